@@ -129,7 +129,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stopBtn.clicked.connect(self.stopBtn.disable)
 
     def _setSensitivityGroupBox(self) -> None:
-        checkedRbtn = sensitivityradiobutton.checkedRadioButton(self)
+        # Only the group box holds the radio buttons, no need to search
+        # through the whole window
+        checkedRbtn = sensitivityradiobutton.checkedRadioButton(self.sensGrp)
         self.preferencesWindow.setSensitivity(checkedRbtn.sensitivity)
 
         self.veryHighRbtn.sensitivityChanged.connect(
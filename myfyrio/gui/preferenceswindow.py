@@ -66,16 +66,17 @@ class PreferencesWindow(QtWidgets.QMainWindow):
         self.setWindowModality(QtCore.Qt.ApplicationModal)
 
     def _gather_widgets(self) -> List[Widget]:
-        widget_types = [QtWidgets.QComboBox, QtWidgets.QCheckBox,
-                        QtWidgets.QSpinBox, QtWidgets.QGroupBox]
+        widget_types = (QtWidgets.QComboBox, QtWidgets.QCheckBox,
+                        QtWidgets.QSpinBox, QtWidgets.QGroupBox)
         widgets = []
 
-        for w_type in widget_types:
-            for w in self.findChildren(w_type):
-                # Every widget that keeps some preference value
-                # has a 'conf_param' property
-                if w.property('conf_param') is not None:
-                    widgets.append(w)
+        # Walk the widget tree once and pick the widgets of all the types
+        for w in self.findChildren(QtWidgets.QWidget):
+            # Every widget that keeps some preference value
+            # has a 'conf_param' property
+            if (isinstance(w, widget_types)
+                    and w.property('conf_param') is not None):
+                widgets.append(w)
         return widgets
 
     def _init_widgets(self) -> None:
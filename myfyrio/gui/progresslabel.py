@@ -37,6 +37,6 @@ class ProgressLabel(QtWidgets.QLabel):
         :param number: number to set
         '''
 
-        text = self.text().split(' ')
-        text[-1] = str(number)
-        self.setText(' '.join(text))
+        # Only the last word is the number, the rest is kept as is
+        prefix, sep, _ = self.text().rpartition(' ')
+        self.setText(prefix + sep + str(number))
@@ -105,7 +105,12 @@ class ThumbnailWidget(QtWidgets.QLabel):
 
         size = self._size
         err_img = resources.Image.ERR_IMG.get() # pylint: disable=no-member
-        err_pixmap = QtGui.QPixmap(err_img)
+        # Every broken image gets the same picture, so it is decoded once
+        # and then taken from the application-wide pixmap cache
+        err_pixmap = QtGui.QPixmapCache.find(err_img)
+        if err_pixmap is None:
+            err_pixmap = QtGui.QPixmap(err_img)
+            QtGui.QPixmapCache.insert(err_img, err_pixmap)
         return err_pixmap.scaled(size, size)
 
     def _makeThumbnail(self) -> None:
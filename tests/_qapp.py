@@ -0,0 +1,43 @@
+'''Copyright 2020 Maxim Shpak <maxim.shpak@posteo.uk>
+
+This file is part of Myfyrio.
+
+Myfyrio is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Myfyrio is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
+
+-------------------------------------------------------------------------------
+
+The QApplication instance the tests build their widgets in. The test
+modules get it from here, so they work under both pytest and unittest
+'''
+
+import os
+
+from PyQt5 import QtWidgets
+
+# Widgets are created and painted in memory, no display is needed. Set
+# the variable to another platform plugin to see the widgets
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def instance() -> QtWidgets.QApplication:
+    '''Return the only QApplication instance of the process, create it if
+    there is none yet. Tests must not quit or delete it
+
+    :return: QApplication instance
+    '''
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
@@ -0,0 +1,56 @@
+'''Copyright 2019-2020 Maxim Shpak <maxim.shpak@posteo.uk>
+
+This file is part of Myfyrio.
+
+Myfyrio is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Myfyrio is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
+
+-------------------------------------------------------------------------------
+
+Shared fixtures of the test suite
+'''
+
+import logging
+
+import pytest
+from PyQt5 import QtCore
+
+from tests import _qapp
+
+# The application logger is configured once for all the test modules.
+# Errors the tests provoke on purpose are not printed to the terminal
+logger = logging.getLogger('main')
+logger.setLevel(logging.WARNING)
+if not logger.handlers:
+    logger.addHandler(logging.NullHandler())
+
+
+@pytest.fixture(scope='session', autouse=True)
+def qapp():
+    '''Create the only QApplication instance of the test session. Every
+    pytest-xdist worker runs its own session, so each worker process gets
+    its own instance
+    '''
+
+    return _qapp.instance()
+
+
+@pytest.fixture(autouse=True)
+def deferred_delete(qapp):
+    '''Delete the objects scheduled with "deleteLater" by the test. The
+    suite never runs an event loop, so without this they would pile up
+    until the worker exits
+    '''
+
+    yield
+    qapp.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
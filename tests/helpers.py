@@ -0,0 +1,74 @@
+'''Copyright 2020 Maxim Shpak <maxim.shpak@posteo.uk>
+
+This file is part of Myfyrio.
+
+Myfyrio is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Myfyrio is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
+
+-------------------------------------------------------------------------------
+
+Helpers shared by the test modules
+'''
+
+import functools
+import logging
+from unittest import mock
+
+
+def captureErrors(test, logger_name):
+    '''Collect the ERROR records of the :logger_name: logger until :test:
+    is finished. Cheaper than "assertLogs" that swaps the logger's
+    handlers and level on every call
+
+    :param test:        test case (the handler is removed in its cleanup),
+    :param logger_name: name of the logger to listen to,
+    :return:            list the records are appended to
+    '''
+
+    records = []
+    handler = logging.Handler(logging.ERROR)
+    handler.emit = records.append
+
+    logger = logging.getLogger(logger_name)
+    logger.addHandler(handler)
+    test.addCleanup(logger.removeHandler, handler)
+
+    return records
+
+
+@functools.lru_cache(maxsize=None)
+def specOf(cls):
+    '''Return the attribute names of :cls: to pass to "mock.Mock" as
+    the spec. Given the class itself, "mock.Mock" walks it on every call
+    (the Qt classes are huge), while the list is made once per class for
+    all the test modules
+
+    :param cls: class the mock stands in for,
+    :return:    list of the attribute names
+    '''
+
+    return dir(cls)
+
+
+def connectMockSlot(test, signal):
+    '''Connect a mock slot to :signal: for the duration of :test:
+
+    :param test: TestCase instance the slot is disconnected after,
+    :param signal: bound Qt signal to connect the slot to,
+    :return: the connected mock.Mock
+    '''
+
+    mock_slot = mock.Mock()
+    signal.connect(mock_slot)
+    test.addCleanup(signal.disconnect, mock_slot)
+    return mock_slot
@@ -499,32 +499,34 @@ class TestMethodScaled(TestClassImage):
 
 class TestMethodSetDimensions(TestClassImage):
 
+    def setUp(self):
+        super().setUp()
+
+        self.mock_qimg = mock.Mock(spec=QtGui.QImage)
+        self.mock_qsize = mock.Mock(spec=QtCore.QSize)
+        self.mock_qimg.size.return_value = self.mock_qsize
+
+        patcher = mock.patch('PyQt5.QtGui.QImageReader',
+                             return_value=self.mock_qimg)
+        self.mock_qimg_reader = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_QImageReader_called_with_path_arg(self):
-        with mock.patch('PyQt5.QtGui.QImageReader') as mock_qimg_reader:
-            self.image._set_dimensions()
+        self.image._set_dimensions()
 
-        mock_qimg_reader.assert_called_once_with(self.image.path)
+        self.mock_qimg_reader.assert_called_once_with(self.image.path)
 
     def test_raise_OSError_if_read_size_is_not_valid(self):
-        mock_qimg = mock.Mock(spec=QtGui.QImage)
-        mock_qsize = mock.Mock(spec=QtCore.QSize)
-        mock_qsize.isValid.return_value = False
-        mock_qimg.size.return_value = mock_qsize
-        with mock.patch('PyQt5.QtGui.QImageReader', return_value=mock_qimg):
-            with self.assertRaises(OSError):
-                self.image._set_dimensions()
+        self.mock_qsize.isValid.return_value = False
+        with self.assertRaises(OSError):
+            self.image._set_dimensions()
 
     def test_width_and_height_assigned_to_proper_attrs(self):
         width = 333
         height = 444
-        mock_qimg = mock.Mock(spec=QtGui.QImage)
-        mock_qsize = mock.Mock(spec=QtCore.QSize)
-        mock_qimg.size.return_value = mock_qsize
-        mock_qsize.width.return_value = width
-        mock_qsize.height.return_value = height
-
-        with mock.patch('PyQt5.QtGui.QImageReader', return_value=mock_qimg):
-            self.image._set_dimensions()
+        self.mock_qsize.width.return_value = width
+        self.mock_qsize.height.return_value = height
+        self.image._set_dimensions()
 
         self.assertEqual(self.image._width, width)
         self.assertEqual(self.image._height, height)
@@ -566,19 +568,24 @@ class TestPropertyHeight(TestClassImage):
 
 class TestMethodSetFilesize(TestClassImage):
 
-    @mock.patch('os.path.getsize', return_value=1024)
-    def test_getsize_called_with_image_path_arg(self, mock_size):
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch('os.path.getsize', return_value=1024)
+        self.mock_getsize = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_getsize_called_with_image_path_arg(self):
         self.image.filesize()
 
-        mock_size.assert_called_once_with(self.image.path)
+        self.mock_getsize.assert_called_once_with(self.image.path)
 
-    @mock.patch('os.path.getsize', side_effect=OSError)
-    def test_raise_OSError_if_getsize_raise_OSError(self, mock_size):
+    def test_raise_OSError_if_getsize_raise_OSError(self):
+        self.mock_getsize.side_effect = OSError
         with self.assertRaises(OSError):
             self.image.filesize()
 
-    @mock.patch('os.path.getsize', return_value=1024)
-    def test_assign_result_of_getsize_to_size_attr(self, mock_size):
+    def test_assign_result_of_getsize_to_size_attr(self):
         self.image.filesize(core.SizeFormat.B)
 
         self.assertEqual(self.image.size, 1024)
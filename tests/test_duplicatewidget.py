@@ -16,53 +16,100 @@ You should have received a copy of the GNU General Public License
 along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-import logging
-import sys
 from subprocess import CalledProcessError
 from unittest import TestCase, mock
 
-from PyQt5 import QtCore, QtGui, QtTest, QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 
 from myfyrio import core
-from myfyrio.gui import duplicatewidget, infolabel, thumbnailwidget
+from myfyrio.gui import (duplicatewidget, errornotifier, infolabel,
+                         thumbnailwidget, utils)
+from tests import _qapp, helpers
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+DW_CLS = duplicatewidget.DuplicateWidget
+DW_LOGGER = 'main.duplicatewidget'
+
+IMAGE_SPEC = helpers.specOf(core.Image)
+LAYOUT_SPEC = helpers.specOf(QtWidgets.QVBoxLayout)
+THUMBNAIL_SPEC = helpers.specOf(thumbnailwidget.ThumbnailWidget)
+SIMILARITY_SPEC = helpers.specOf(infolabel.SimilarityLabel)
+IMAGE_SIZE_SPEC = helpers.specOf(infolabel.ImageSizeLabel)
+IMAGE_PATH_SPEC = helpers.specOf(infolabel.ImagePathLabel)
+MENU_SPEC = helpers.specOf(QtWidgets.QMenu)
+CONTEXT_MENU_EVENT_SPEC = helpers.specOf(QtGui.QContextMenuEvent)
+HIDE_EVENT_SPEC = helpers.specOf(QtGui.QHideEvent)
+
+# Patchers of the targets used by many tests. "mock.patch.object" takes
+# the object itself, so the dotted path does not have to be resolved
+# every time a test is run
+def patchErrorMessage():
+    return mock.patch.object(errornotifier, 'errorMessage')
+
+
+def patchOpenFile(**kwargs):
+    return mock.patch.object(utils, 'openFile', **kwargs)
+
+
+def patchGetText(ok):
+    return mock.patch.object(QtWidgets.QInputDialog, 'getText',
+                             return_value=('new_name', ok))
 
-DW_MODULE = 'myfyrio.gui.duplicatewidget.'
 
 # pylint: disable=unused-argument,missing-class-docstring
 
 
 class TestDuplicateWidget(TestCase):
 
-    DW = DW_MODULE + 'DuplicateWidget.'
+    # Preferences the widget is built with in 'setUp'
+    CONF = {'size': 200,
+            'size_format': 1,
+            'show_similarity': False,
+            'show_size': False,
+            'show_path': False,
+            'delete_dirs': False}
 
     def setUp(self):
-        self.conf = {'size': 200,
-                     'size_format': 1,
-                     'show_similarity': False,
-                     'show_size': False,
-                     'show_path': False,
-                     'delete_dirs': False}
-        self.mock_image = mock.Mock(spec=core.Image)
+        self.conf = dict(self.CONF)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
+
+        # '_setThumbnailWidget' is only called by '__init__', so it is
+        # patched only while the widget is being built
+        with mock.patch.object(DW_CLS, '_setThumbnailWidget'):
+            self.w = duplicatewidget.DuplicateWidget(self.mock_image,
+                                                     self.conf)
+
+
+class TestDuplicateWidgetNoQt(TestCase):
+
+    # For the methods that do not touch the Qt side of the widget. The widget
+    # is created bypassing '__init__', so no underlying QWidget is made
+
+    def setUp(self):
+        self.conf = dict(TestDuplicateWidget.CONF)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
+
+        self.w = duplicatewidget.DuplicateWidget.__new__(
+            duplicatewidget.DuplicateWidget
+        )
+        self.w.image = self.mock_image
+        self.w._conf = self.conf
+        self.w._selected = False
+
 
-        with mock.patch(self.DW+'_setThumbnailWidget'):
-            self.w = duplicatewidget.DuplicateWidget(
-                self.mock_image, self.conf
-            )
+class TestDuplicateWidgetMethodInit(TestCase):
 
+    # The tests only read the state '__init__' leaves, so they share a widget
+    @classmethod
+    def setUpClass(cls):
+        cls.conf = dict(TestDuplicateWidget.CONF)
+        cls.mock_image = mock.Mock(spec=IMAGE_SPEC)
 
-class TestDuplicateWidgetMethodInit(TestDuplicateWidget):
+        with mock.patch.object(DW_CLS, '_setThumbnailWidget') as mock_setThumb:
+            cls.w = duplicatewidget.DuplicateWidget(cls.mock_image, cls.conf)
+        cls.mock_setThumbnailWidget = mock_setThumb
 
     def test_init_values(self):
         self.assertEqual(self.w.image, self.mock_image)
@@ -73,321 +120,275 @@ class TestDuplicateWidgetMethodInit(TestDuplicateWidget):
         self.assertEqual(self.w.maximumWidth(), self.conf['size'])
 
     def test_layout(self):
-        margins = self.w._layout.contentsMargins()
-        self.assertEqual(margins.top(), 0)
-        self.assertEqual(margins.right(), 0)
-        self.assertEqual(margins.bottom(), 0)
-        self.assertEqual(margins.left(), 0)
+        m = self.w._layout.contentsMargins()
+        margins = (m.top(), m.right(), m.bottom(), m.left())
+        self.assertTupleEqual(margins, (0, 0, 0, 0))
 
         self.assertIsInstance(self.w._layout, QtWidgets.QVBoxLayout)
 
     def test_setThumbnailWidget_called(self):
-        with mock.patch(self.DW+'_setThumbnailWidget') as mock_th_call:
-            self.w = duplicatewidget.DuplicateWidget(
-                self.mock_image, self.conf
-            )
-
-        mock_th_call.assert_called_once_with()
-
-    def test_setSimilarityLabel_called_if_show_similarity_True(self):
-        self.conf['show_similarity'] = True
-        with mock.patch(self.DW+'_setThumbnailWidget'):
-            with mock.patch(self.DW+'_setSimilarityLabel') as mock_sim_call:
-                self.w = duplicatewidget.DuplicateWidget(
-                    self.mock_image, self.conf
-                )
-
-        mock_sim_call.assert_called_once_with()
-
-    def test_setImageSizeLabel_called_if_show_size_True(self):
-        self.conf['show_size'] = True
-        with mock.patch(self.DW+'_setThumbnailWidget'):
-            with mock.patch(self.DW+'_setImageSizeLabel') as mock_size_call:
-                self.w = duplicatewidget.DuplicateWidget(
-                    self.mock_image, self.conf
-                )
-
-        mock_size_call.assert_called_once_with()
-
-    def test_setImagePathLabel_called_if_show_path_True(self):
-        self.conf['show_path'] = True
-        with mock.patch(self.DW+'_setThumbnailWidget'):
-            with mock.patch(self.DW+'_setImagePathLabel') as mock_path_call:
-                self.w = duplicatewidget.DuplicateWidget(
-                    self.mock_image, self.conf
-                )
-
-        mock_path_call.assert_called_once_with()
-
-    def test_setFixedWidth_called_with_conf_size_arg(self):
-        with mock.patch(self.DW+'_setThumbnailWidget'):
-            with mock.patch(self.DW+'setFixedWidth') as mock_width_call:
-                self.w = duplicatewidget.DuplicateWidget(
-                    self.mock_image, self.conf
-                )
+        self.mock_setThumbnailWidget.assert_called_once_with()
+
+    @mock.patch.object(DW_CLS, '_setThumbnailWidget')
+    @mock.patch.object(DW_CLS, 'setFixedWidth')
+    def test_setFixedWidth_called_with_conf_size_arg(self, mock_width_call,
+                                                     mock_setThumbnail):
+        duplicatewidget.DuplicateWidget(self.mock_image, self.conf)
 
         mock_width_call.assert_called_once_with(self.conf['size'])
 
 
+class TestDuplicateWidgetMethodInitInfoLabels(TestCase):
+
+    # Preference that turns a label on and the method that sets the label
+    SETTERS = (('show_similarity', '_setSimilarityLabel'),
+               ('show_size', '_setImageSizeLabel'),
+               ('show_path', '_setImagePathLabel'))
+
+    def setUp(self):
+        patcher = mock.patch.object(DW_CLS, '_setThumbnailWidget')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_setter_of_enabled_label_called(self):
+        for flag, setter in self.SETTERS:
+            with self.subTest(flag=flag):
+                conf = dict(TestDuplicateWidget.CONF, **{flag: True})
+                setters = {name: mock.DEFAULT for _, name in self.SETTERS}
+                with mock.patch.multiple(DW_CLS, **setters) as mock_setters:
+                    duplicatewidget.DuplicateWidget(
+                        mock.Mock(spec=IMAGE_SPEC), conf
+                    )
+
+                mock_setters.pop(setter).assert_called_once_with()
+                for mock_other in mock_setters.values():
+                    mock_other.assert_not_called()
+
+
+@mock.patch.object(thumbnailwidget, 'ThumbnailWidget')
 class TestMethodSetThumbnailWidget(TestDuplicateWidget):
 
-    ThW = 'myfyrio.gui.thumbnailwidget.ThumbnailWidget'
+    CONF = {**TestDuplicateWidget.CONF, 'lazy': True}
 
     def setUp(self):
         super().setUp()
 
-        self.conf['lazy'] = True
+        self.w._layout = mock.Mock(spec=LAYOUT_SPEC)
 
-        self.w._layout = mock.Mock(spec=QtWidgets.QVBoxLayout)
+        self.mock_thumbnailW = mock.Mock(spec=THUMBNAIL_SPEC)
 
-        self.mock_thumbnailW = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
-
-    def test_ThumbnailWidget_called_with_image__conf_size_and_lazy_args(self):
-        with mock.patch(self.ThW) as mock_th_call:
-            self.w._setThumbnailWidget()
+    def test_ThumbnailWidget_called_with_image__conf_size_and_lazy_args(
+            self, mock_th_call
+    ):
+        self.w._setThumbnailWidget()
 
         mock_th_call.assert_called_once_with(
             self.mock_image, self.conf['size'], self.conf['lazy']
         )
 
-    def test_addWidget_called_with_ThumbnailWidget_result(self):
-        with mock.patch(self.ThW, return_value=self.mock_thumbnailW):
-            self.w._setThumbnailWidget()
+    def test_addWidget_called_with_ThumbnailWidget_result(self, mock_th_call):
+        mock_th_call.return_value = self.mock_thumbnailW
+        self.w._setThumbnailWidget()
 
         self.w._layout.addWidget.assert_called_once_with(self.mock_thumbnailW)
 
-    def test_horizontal_alignment(self):
-        with mock.patch(self.ThW, return_value=self.mock_thumbnailW):
-            self.w._setThumbnailWidget()
+    def test_horizontal_alignment(self, mock_th_call):
+        mock_th_call.return_value = self.mock_thumbnailW
+        self.w._setThumbnailWidget()
 
         self.w._layout.setAlignment.assert_called_once_with(
             self.mock_thumbnailW, QtCore.Qt.AlignHCenter
         )
 
-    def test_return_ThumbnailWidget_result(self):
-        with mock.patch(self.ThW, return_value=self.mock_thumbnailW):
-            res = self.w._setThumbnailWidget()
+    def test_return_ThumbnailWidget_result(self, mock_th_call):
+        mock_th_call.return_value = self.mock_thumbnailW
+        res = self.w._setThumbnailWidget()
 
         self.assertEqual(res, self.mock_thumbnailW)
 
 
 class TestMethodSetSimilarityLabel(TestDuplicateWidget):
 
-    SL = 'myfyrio.gui.infolabel.SimilarityLabel'
-
     def setUp(self):
         super().setUp()
 
-        self.w._layout = mock.Mock(spec=QtWidgets.QVBoxLayout)
+        self.w._layout = mock.Mock(spec=LAYOUT_SPEC)
+
+        self.mock_similarityL = mock.Mock(spec=SIMILARITY_SPEC)
 
-        self.mock_similarityL = mock.Mock(spec=infolabel.SimilarityLabel)
+        patcher = mock.patch.object(infolabel, 'SimilarityLabel',
+                                    return_value=self.mock_similarityL)
+        self.mock_SimilarityLabel = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_SimilarityLabel_called_with_similarity_and_conf_size_args(self):
         self.mock_image.similarity.return_value = 13
-        with mock.patch(self.SL,
-                        return_value=self.mock_similarityL) as mock_label_call:
-            self.w._setSimilarityLabel()
+        self.w._setSimilarityLabel()
 
-        mock_label_call.assert_called_once_with('13%', self.conf['size'])
+        self.mock_SimilarityLabel.assert_called_once_with(
+            '13%', self.conf['size']
+        )
 
     def test_addWidget_called_with_SimilarityLabel_result(self):
-        with mock.patch(self.SL, return_value=self.mock_similarityL):
-            self.w._setSimilarityLabel()
+        self.w._setSimilarityLabel()
 
         self.w._layout.addWidget.assert_called_once_with(self.mock_similarityL)
 
     def test_return_SimilarityLabel_result(self):
-        with mock.patch(self.SL, return_value=self.mock_similarityL):
-            res = self.w._setSimilarityLabel()
+        res = self.w._setSimilarityLabel()
 
         self.assertEqual(res, self.mock_similarityL)
 
 
 class TestMethodSetImageSizeLabel(TestDuplicateWidget):
 
-    ISL = 'myfyrio.gui.infolabel.ImageSizeLabel'
-
     def setUp(self):
         super().setUp()
 
         self.conf['size_format'] = 0 # Bytes
-        self.w._layout = mock.Mock(spec=QtWidgets.QVBoxLayout)
+        self.w._layout = mock.Mock(spec=LAYOUT_SPEC)
 
-        self.mock_sizeL = mock.Mock(spec=infolabel.ImageSizeLabel)
+        self.mock_sizeL = mock.Mock(spec=IMAGE_SIZE_SPEC)
 
-        type(self.mock_image).width = mock.PropertyMock(return_value=33)
-        type(self.mock_image).height = mock.PropertyMock(return_value=55)
+        patcher = mock.patch.object(infolabel, 'ImageSizeLabel',
+                                    return_value=self.mock_sizeL)
+        self.mock_ImageSizeLabel = patcher.start()
+        self.addCleanup(patcher.stop)
 
-    def test_ImageSizeLabel_called_with_w_h_Fsize_units_conf_size_args(self):
+        self.mock_image.width = 33
+        self.mock_image.height = 55
         self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL,
-                        return_value=self.mock_sizeL) as mock_label_call:
-            self.w._setImageSizeLabel()
 
-        mock_label_call.assert_called_once_with(33, 55, 5000, 'B', 200)
+    def test_ImageSizeLabel_called_with_w_h_Fsize_units_conf_size_args(self):
+        self.w._setImageSizeLabel()
+
+        self.mock_ImageSizeLabel.assert_called_once_with(
+            33, 55, 5000, 'B', 200
+        )
 
     def test_image_filesize_called_with_SizeFormat_B(self):
-        self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            self.w._setImageSizeLabel()
+        self.w._setImageSizeLabel()
 
         self.mock_image.filesize.assert_called_once_with(core.SizeFormat.B)
 
-    def test_ImageSizeLabel_called_with_w_0_h_0_if_width_raise_OSError(self):
-        type(self.mock_image).width = mock.PropertyMock(side_effect=OSError)
-        self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL,
-                        return_value=self.mock_sizeL) as mock_label_call:
-            self.w._setImageSizeLabel()
-
-        mock_label_call.assert_called_once_with(0, 0, 5000, 'B', 200)
-
-    def test_logging_if_width_raise_OSError(self):
-        type(self.mock_image).width = mock.PropertyMock(side_effect=OSError)
-        self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                self.w._setImageSizeLabel()
-
-    def test_ImageSizeLabel_called_with_w_0_h_0_if_height_raise_OSError(self):
-        type(self.mock_image).height = mock.PropertyMock(side_effect=OSError)
-        self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL,
-                        eturn_value=self.mock_sizeL) as mock_label_call:
-            self.w._setImageSizeLabel()
-
-        mock_label_call.assert_called_once_with(0, 0, 5000, 'B', 200)
-
-    def test_logging_if_height_raise_OSError(self):
-        type(self.mock_image).height = mock.PropertyMock(side_effect=OSError)
-        self.mock_image.filesize.return_value = 5000
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                self.w._setImageSizeLabel()
-
-    def test_ImageSizeLabel_called_with_size_0_if_filesize_raise_OSError(self):
-        self.mock_image.filesize.side_effect = OSError
-        with mock.patch(self.ISL,
-                        return_value=self.mock_sizeL) as mock_label_call:
-            self.w._setImageSizeLabel()
-
-        mock_label_call.assert_called_once_with(33, 55, 0, 'B', 200)
-
-    def test_logging_if_filesize_raise_OSError(self):
-        self.mock_image.filesize.side_effect = OSError
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                self.w._setImageSizeLabel()
+    def test_log_error_and_use_0_values_if_image_attr_raise_OSError(self):
+        # Attribute raising OSError and the expected "ImageSizeLabel" args
+        cases = (('width', (0, 0, 5000, 'B', 200)),
+                 ('height', (0, 0, 5000, 'B', 200)),
+                 ('filesize', (33, 55, 0, 'B', 200)))
+        for attr, args in cases:
+            with self.subTest(attr=attr):
+                self.mock_ImageSizeLabel.reset_mock()
+                if attr == 'filesize':
+                    raising = mock.patch.object(self.mock_image, attr,
+                                                side_effect=OSError)
+                else:
+                    raising = mock.patch.object(
+                        type(self.mock_image), attr, create=True,
+                        new_callable=mock.PropertyMock, side_effect=OSError
+                    )
+
+                error_records = helpers.captureErrors(self, DW_LOGGER)
+                with raising:
+                    self.w._setImageSizeLabel()
+
+                self.assertTrue(error_records)
+                self.mock_ImageSizeLabel.assert_called_once_with(*args)
 
     def test_addWidget_called_with_ImageSizeLabel_result(self):
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            self.w._setImageSizeLabel()
+        self.w._setImageSizeLabel()
 
         self.w._layout.addWidget.assert_called_once_with(self.mock_sizeL)
 
     def test_return_ImageSizeLabel_result(self):
-        with mock.patch(self.ISL, return_value=self.mock_sizeL):
-            res = self.w._setImageSizeLabel()
+        res = self.w._setImageSizeLabel()
 
         self.assertEqual(res, self.mock_sizeL)
 
 
 class TestMethodSetImagePathLabel(TestDuplicateWidget):
 
-    IPL = 'myfyrio.gui.infolabel.ImagePathLabel'
-
     def setUp(self):
         super().setUp()
 
         self.mock_image.path = 'image_path'
 
-        self.w._layout = mock.Mock(spec=QtWidgets.QVBoxLayout)
+        self.w._layout = mock.Mock(spec=LAYOUT_SPEC)
+
+        self.mock_pathL = mock.Mock(spec=IMAGE_PATH_SPEC)
 
-        self.mock_pathL = mock.Mock(spec=infolabel.ImagePathLabel)
+        patcher = mock.patch.object(infolabel, 'ImagePathLabel',
+                                    return_value=self.mock_pathL)
+        self.mock_ImagePathLabel = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_ImagePathLabel_called_with_image_path_and_conf_size_args(self):
-        with mock.patch(self.IPL,
-                        return_value=self.mock_pathL) as mock_label_call:
-            self.w._setImagePathLabel()
+        self.w._setImagePathLabel()
 
-        mock_label_call.assert_called_once_with(
+        self.mock_ImagePathLabel.assert_called_once_with(
             self.mock_image.path, self.conf['size']
         )
 
     def test_addWidget_called_with_ImagePathLabel_result(self):
-        with mock.patch(self.IPL, return_value=self.mock_pathL):
-            self.w._setImagePathLabel()
+        self.w._setImagePathLabel()
 
         self.w._layout.addWidget.assert_called_once_with(self.mock_pathL)
 
     def test_return_ImagePathLabel_result(self):
-        with mock.patch(self.IPL, return_value=self.mock_pathL):
-            res = self.w._setImagePathLabel()
+        res = self.w._setImagePathLabel()
 
         self.assertEqual(res, self.mock_pathL)
 
 
-class TestDuplicateWidgetMethodOpenImage(TestDuplicateWidget):
-
-    PATCH_ERRM = 'myfyrio.gui.errornotifier.errorMessage'
-    PATCH_OPENFILE = 'myfyrio.gui.utils.openFile'
+class TestDuplicateWidgetMethodOpenImage(TestDuplicateWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
-        self.real_platform = sys.platform
-
         self.mock_image.path = 'path'
-
-    def tearDown(self):
-        sys.platform = self.real_platform
+        self.error_records = helpers.captureErrors(self, DW_LOGGER)
 
     def test_openFile_called_with_image_path_arg(self):
-        with mock.patch(self.PATCH_OPENFILE) as mock_openFile:
+        with patchOpenFile() as mock_openFile:
             self.w.openImage()
 
         mock_openFile.assert_called_once_with('path')
 
     def test_log_error_if_subprocess_run_raise_CalledProcessError(self):
-        with mock.patch(self.PATCH_OPENFILE,
-                        side_effect=CalledProcessError(0, 'cmd')):
-            with mock.patch(self.PATCH_ERRM):
-                with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                    self.w.openImage()
+        with patchOpenFile(side_effect=CalledProcessError(0, 'cmd')):
+            with patchErrorMessage():
+                self.w.openImage()
+
+        self.assertTrue(self.error_records)
 
     def test_call_errorMessage_if_raise_CalledProcessError_and_not_Win(self):
-        with mock.patch(self.PATCH_OPENFILE,
-                        side_effect=CalledProcessError(0, 'cmd')):
-            with mock.patch(self.PATCH_ERRM) as mock_msg_call:
+        with patchOpenFile(side_effect=CalledProcessError(0, 'cmd')):
+            with patchErrorMessage() as mock_msg_call:
                 self.w.openImage()
 
         err_msg = ["Something went wrong while opening 'path'"]
         mock_msg_call.assert_called_once_with(err_msg)
 
+    @mock.patch('sys.platform', 'win32')
     def test_not_call_errorMessage_if_raise_CalledProcessError_and_Win(self):
-        sys.platform = 'win32'
-        with mock.patch(self.PATCH_OPENFILE,
-                        side_effect=CalledProcessError(0, 'cmd')):
-            with mock.patch(self.PATCH_ERRM) as mock_msg_call:
+        with patchOpenFile(side_effect=CalledProcessError(0, 'cmd')):
+            with patchErrorMessage() as mock_msg_call:
                 self.w.openImage()
 
         mock_msg_call.assert_not_called()
 
 
-class TestDuplicateWidgetMethodRenameImage(TestDuplicateWidget):
-
-    PATCH_INPUT = 'PyQt5.QtWidgets.QInputDialog.getText'
-    PATCH_ERRN = 'myfyrio.gui.errornotifier.'
+class TestDuplicateWidgetMethodRenameImage(TestDuplicateWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
         self.mock_image.path = '/folder/file'
-        self.w.imagePathLabel = mock.Mock(spec=infolabel.ImagePathLabel)
+        self.w.imagePathLabel = mock.Mock(spec=IMAGE_PATH_SPEC)
+        self.error_records = helpers.captureErrors(self, DW_LOGGER)
 
     def test_QInputDialog_called_with_image_file_name(self):
-        with mock.patch(self.PATCH_INPUT,
-                        return_value=('new_name', False)) as mock_dialog_call:
+        with patchGetText(ok=False) as mock_dialog_call:
             self.w.renameImage()
 
         mock_dialog_call.assert_called_once_with(
@@ -398,19 +399,19 @@ class TestDuplicateWidgetMethodRenameImage(TestDuplicateWidget):
         )
 
     def test_nothing_happens_if_QInputDialog_not_return_ok(self):
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', False)):
+        with patchGetText(ok=False):
             self.w.renameImage()
 
         self.mock_image.rename.assert_not_called()
 
     def test_image_rename_called_with_new_name_arg(self):
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
+        with patchGetText(ok=True):
             self.w.renameImage()
 
         self.mock_image.rename.assert_called_once_with('new_name')
 
     def test_ImagePathLabel_text_changed_if_image_name_is_changed(self):
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
+        with patchGetText(ok=True):
             self.w.renameImage()
 
         self.w.imagePathLabel.setText.assert_called_once_with(
@@ -419,15 +420,16 @@ class TestDuplicateWidgetMethodRenameImage(TestDuplicateWidget):
 
     def test_log_error_if_image_rename_raise_FileExistsError(self):
         self.mock_image.rename.side_effect = FileExistsError
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
-            with mock.patch(self.PATCH_ERRN+'errorMessage'):
-                with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                    self.w.renameImage()
+        with patchGetText(ok=True):
+            with patchErrorMessage():
+                self.w.renameImage()
+
+        self.assertTrue(self.error_records)
 
     def test_call_errorMessage_if_image_rename_raise_FileExistsError(self):
         self.mock_image.rename.side_effect = FileExistsError
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
-            with mock.patch(self.PATCH_ERRN+'errorMessage') as mock_msg_call:
+        with patchGetText(ok=True):
+            with patchErrorMessage() as mock_msg_call:
                 self.w.renameImage()
 
         err_msg = ['File with the name "new_name" already exists']
@@ -435,15 +437,16 @@ class TestDuplicateWidgetMethodRenameImage(TestDuplicateWidget):
 
     def test_log_error_if_image_rename_raise_FileNotFoundError(self):
         self.mock_image.rename.side_effect = FileNotFoundError
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
-            with mock.patch(self.PATCH_ERRN+'errorMessage'):
-                with self.assertLogs('main.duplicatewidget', 'ERROR'):
-                    self.w.renameImage()
+        with patchGetText(ok=True):
+            with patchErrorMessage():
+                self.w.renameImage()
+
+        self.assertTrue(self.error_records)
 
     def test_call_errorMessage_if_image_rename_raise_FileNotFoundError(self):
         self.mock_image.rename.side_effect = FileNotFoundError
-        with mock.patch(self.PATCH_INPUT, return_value=('new_name', True)):
-            with mock.patch(self.PATCH_ERRN+'errorMessage') as mock_msg_call:
+        with patchGetText(ok=True):
+            with patchErrorMessage() as mock_msg_call:
                 self.w.renameImage()
 
         err_msg = ['File with the name "file" does not exist']
@@ -455,29 +458,31 @@ class TestDuplicateWidgetMethodContextMenuEvent(TestDuplicateWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_menu = mock.Mock(spec=QtWidgets.QMenu)
+        self.mock_menu = mock.Mock(spec=MENU_SPEC)
         self.mock_menu.addAction.side_effect = ['Open', 'Rename']
-        self.mock_event = mock.Mock(spec=QtGui.QContextMenuEvent)
+        self.mock_event = mock.Mock(spec=CONTEXT_MENU_EVENT_SPEC)
 
-    @mock.patch(DW_MODULE+'DuplicateWidget.mapToGlobal')
-    @mock.patch(DW_MODULE+'DuplicateWidget.openImage')
-    def test_openImage_called(self, mock_open, mock_map):
+    @mock.patch.multiple(DW_CLS,
+                         mapToGlobal=mock.DEFAULT, openImage=mock.DEFAULT)
+    def test_openImage_called(self, **mocks):
         action = 'Open'
         self.mock_menu.exec_.return_value = action
-        with mock.patch('PyQt5.QtWidgets.QMenu', return_value=self.mock_menu):
+        with mock.patch.object(QtWidgets, 'QMenu',
+                               return_value=self.mock_menu):
             self.w.contextMenuEvent(self.mock_event)
 
-        mock_open.assert_called_once_with()
+        mocks['openImage'].assert_called_once_with()
 
-    @mock.patch(DW_MODULE+'DuplicateWidget.mapToGlobal')
-    @mock.patch(DW_MODULE+'DuplicateWidget.renameImage')
-    def test_renameImage_called(self, mock_rename, mock_map):
+    @mock.patch.multiple(DW_CLS,
+                         mapToGlobal=mock.DEFAULT, renameImage=mock.DEFAULT)
+    def test_renameImage_called(self, **mocks):
         action = 'Rename'
         self.mock_menu.exec_.return_value = action
-        with mock.patch('PyQt5.QtWidgets.QMenu', return_value=self.mock_menu):
+        with mock.patch.object(QtWidgets, 'QMenu',
+                               return_value=self.mock_menu):
             self.w.contextMenuEvent(self.mock_event)
 
-        mock_rename.assert_called_once_with()
+        mocks['renameImage'].assert_called_once_with()
 
 
 class TestDuplicateWidgetMethodSelected_Setter(TestDuplicateWidget):
@@ -485,9 +490,7 @@ class TestDuplicateWidgetMethodSelected_Setter(TestDuplicateWidget):
     def setUp(self):
         super().setUp()
 
-        self.w.thumbnailWidget = mock.Mock(
-            spec=thumbnailwidget.ThumbnailWidget
-        )
+        self.w.thumbnailWidget = mock.Mock(spec=THUMBNAIL_SPEC)
 
     def test_select_widget_if_pass_True(self):
         self.w.selected = True
@@ -510,16 +513,16 @@ class TestDuplicateWidgetMethodSelected_Setter(TestDuplicateWidget):
         self.w.thumbnailWidget.setMarked.assert_called_once_with(False)
 
     def test_emit_signal_clicked_if_pass_True(self):
-        spy = QtTest.QSignalSpy(self.w.clicked)
+        mock_slot = helpers.connectMockSlot(self, self.w.clicked)
         self.w.selected = True
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_emit_signal_clicked_if_pass_False(self):
-        spy = QtTest.QSignalSpy(self.w.clicked)
+        mock_slot = helpers.connectMockSlot(self, self.w.clicked)
         self.w.selected = False
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
 
 class TestDuplicateWidgetMethodHideEvent(TestDuplicateWidget):
@@ -527,13 +530,13 @@ class TestDuplicateWidgetMethodHideEvent(TestDuplicateWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_event = mock.Mock(spec=QtGui.QHideEvent)
+        self.mock_event = mock.Mock(spec=HIDE_EVENT_SPEC)
 
     def test_hidden_signal_emitted(self):
-        spy = QtTest.QSignalSpy(self.w.hidden)
+        mock_slot = helpers.connectMockSlot(self, self.w.hidden)
         self.w.hideEvent(self.mock_event)
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
 
 class TestDuplicateWidgetMethodCallOnImage(TestDuplicateWidget):
@@ -544,6 +547,7 @@ class TestDuplicateWidgetMethodCallOnImage(TestDuplicateWidget):
         self.func = mock.Mock()
         self.arg = 'arg'
         self.kwarg = 'kwarg'
+        self.error_records = helpers.captureErrors(self, DW_LOGGER)
 
     def test_func_called_with_args_kwargs(self):
         self.w._callOnImage(self.func, self.arg, kwarg=self.kwarg)
@@ -558,7 +562,7 @@ class TestDuplicateWidgetMethodCallOnImage(TestDuplicateWidget):
         self.assertFalse(self.w.selected)
 
     def test_hide_called_if_no_exception(self):
-        with mock.patch(self.DW+'hide') as mock_hide_call:
+        with mock.patch.object(DW_CLS, 'hide') as mock_hide_call:
             self.w._callOnImage(self.func, self.arg, kwarg=self.kwarg)
 
         mock_hide_call.assert_called_once_with()
@@ -576,28 +580,28 @@ class TestDuplicateWidgetMethodCallOnImage(TestDuplicateWidget):
 
     def test_logging_if_func_raise_OSError(self):
         self.func.side_effect = OSError
-        with self.assertLogs('main.duplicatewidget', 'ERROR'):
-            self.w._callOnImage(self.func, self.arg, kwarg=self.kwarg)
+        self.w._callOnImage(self.func, self.arg, kwarg=self.kwarg)
+
+        self.assertTrue(self.error_records)
 
     def test_emit_error_signal_with_err_msg_if_func_raise_OSError(self):
         self.func.side_effect = OSError('Error message')
-        spy = QtTest.QSignalSpy(self.w.error)
+        mock_slot = helpers.connectMockSlot(self, self.w.error)
         self.w._callOnImage(self.func, self.arg, kwarg=self.kwarg)
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 'Error message')
+        mock_slot.assert_called_once_with('Error message')
 
 
-class TestDuplicateWidgetMethodDelete(TestDuplicateWidget):
+class TestDuplicateWidgetMethodDelete(TestDuplicateWidgetNoQt):
 
     def test_callOnImage_called_with_Image_delete_func_arg(self):
-        with mock.patch(self.DW+'_callOnImage') as mock_call:
+        with mock.patch.object(DW_CLS, '_callOnImage') as mock_call:
             self.w.delete()
 
         mock_call.assert_called_once_with(core.Image.delete)
 
 
-class TestDuplicateWidgetMethodMove(TestDuplicateWidget):
+class TestDuplicateWidgetMethodMove(TestDuplicateWidgetNoQt):
 
     def setUp(self):
         super().setUp()
@@ -605,7 +609,7 @@ class TestDuplicateWidgetMethodMove(TestDuplicateWidget):
         self.new_dst = 'new_folder'
 
     def test_callOnImage_called_with_Image_move_func_and_dst_args(self):
-        with mock.patch(self.DW+'_callOnImage') as mock_call:
+        with mock.patch.object(DW_CLS, '_callOnImage') as mock_call:
             self.w.move(self.new_dst)
 
         mock_call.assert_called_once_with(core.Image.move, self.new_dst)
@@ -18,8 +18,6 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtWidgets
-
 from myfyrio.gui.errornotifier import errorMessage
 
 # pylint: disable=missing-class-docstring
@@ -30,19 +28,22 @@ class TestFuncErrorMessage(TestCase):
     def setUp(self):
         super().setUp()
 
-        self.mock_msgBox = mock.Mock(spec=QtWidgets.QMessageBox)
+        # 'errorMessage' only calls 'exec' on the box, so that is the whole
+        # spec (QMessageBox itself has hundreds of attributes)
+        self.mock_msgBox = mock.Mock(spec_set=['exec'])
+
+        patcher = mock.patch('PyQt5.QtWidgets.QMessageBox',
+                             return_value=self.mock_msgBox)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_QMessageBox_exec_not_called_if_no_errors(self):
-        with mock.patch('PyQt5.QtWidgets.QMessageBox',
-                        return_value=self.mock_msgBox):
-            errorMessage([])
+        errorMessage([])
 
         self.mock_msgBox.exec.assert_not_called()
 
     def test_QMessageBox_exec_called_if_errors(self):
         errors = ['Error']
-        with mock.patch('PyQt5.QtWidgets.QMessageBox',
-                        return_value=self.mock_msgBox):
-            errorMessage(errors)
+        errorMessage(errors)
 
         self.mock_msgBox.exec.assert_called_once_with()
@@ -17,37 +17,71 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
 
+from types import SimpleNamespace
 from unittest import TestCase, mock
 
 from PyQt5 import QtCore, QtWidgets
 
 from myfyrio import core
 from myfyrio.gui import duplicatewidget, imagegroupwidget
+from tests import _qapp, helpers
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
-IGW_MODULE = 'myfyrio.gui.imagegroupwidget.'
+IGW_CLS = imagegroupwidget.ImageGroupWidget
+
+IMAGE_SPEC = helpers.specOf(core.Image)
+DUPLICATE_WIDGET_SPEC = helpers.specOf(duplicatewidget.DuplicateWidget)
+HBOX_LAYOUT_SPEC = helpers.specOf(QtWidgets.QHBoxLayout)
 
 # pylint: disable=missing-class-docstring
 
 
-class TestImageGroupWidget(TestCase):
+class TestImageGroupWidgetImages(TestCase):
+
+    # The image is only passed around and compared by identity (nothing is
+    # configured on it or asserted about its calls), so one mock serves
+    # all the tests
+    mock_image = mock.Mock(spec=IMAGE_SPEC)
+    image_group = [mock_image]
+
 
-    IGW = IGW_MODULE + 'ImageGroupWidget.'
+class TestImageGroupWidget(TestImageGroupWidgetImages):
 
     def setUp(self):
         self.conf = {}
-        self.mock_image = mock.Mock(spec=core.Image)
-        self.image_group = [self.mock_image]
-        with mock.patch(self.IGW+'addDuplicateWidget'):
+        with mock.patch.object(IGW_CLS, 'addDuplicateWidget'):
             self.w = imagegroupwidget.ImageGroupWidget(self.conf,
                                                        self.image_group)
 
 
-class TestImageGroupWidgetMethodInit(TestImageGroupWidget):
+class TestImageGroupWidgetNoQt(TestCase):
+
+    # For the methods that only work with the list of "DuplicateWidget"s.
+    # '__init__' is skipped, so no QWidget and layout are made per test
+
+    def setUp(self):
+        self.conf = {}
+
+        self.w = imagegroupwidget.ImageGroupWidget.__new__(
+            imagegroupwidget.ImageGroupWidget
+        )
+        self.w._conf = self.conf
+        self.w.widgets = []
+        self.w._visible_num = 0
+
+
+class TestImageGroupWidgetMethodInit(TestImageGroupWidgetImages):
+
+    # The first tests only read what '__init__' sets up and the others make
+    # their own widgets, so the whole class can do with one widget
+    @classmethod
+    def setUpClass(cls):
+        cls.conf = {}
+        with mock.patch.object(IGW_CLS, 'addDuplicateWidget'):
+            cls.w = imagegroupwidget.ImageGroupWidget(cls.conf,
+                                                      cls.image_group)
 
     def test_initial_value(self):
         self.assertDictEqual(self.w._conf, self.conf)
@@ -55,11 +89,9 @@ class TestImageGroupWidgetMethodInit(TestImageGroupWidget):
         self.assertEqual(self.w._visible_num, 0)
 
     def test_widget_layout(self):
-        margins = self.w._layout.contentsMargins()
-        self.assertEqual(margins.top(), 0)
-        self.assertEqual(margins.right(), 0)
-        self.assertEqual(margins.bottom(), 0)
-        self.assertEqual(margins.left(), 0)
+        m = self.w._layout.contentsMargins()
+        margins = (m.top(), m.right(), m.bottom(), m.left())
+        self.assertTupleEqual(margins, (0, 0, 0, 0))
 
         self.assertEqual(self.w._layout.spacing(), 10)
         self.assertIsInstance(self.w._layout, QtWidgets.QHBoxLayout)
@@ -67,95 +99,81 @@ class TestImageGroupWidgetMethodInit(TestImageGroupWidget):
                          QtWidgets.QLayout.SetFixedSize)
 
     def test_addDuplicateWidget_called_with_image_group_arg_if_passed(self):
-        with mock.patch(self.IGW+'addDuplicateWidget') as mock_dupl_call:
+        with mock.patch.object(IGW_CLS, 'addDuplicateWidget') as mock_dupl:
             imagegroupwidget.ImageGroupWidget(self.conf, self.image_group)
 
-        mock_dupl_call.assert_called_once_with(self.mock_image)
+        mock_dupl.assert_called_once_with(self.mock_image)
 
     def test_addDuplicateWidget_not_called_if_image_group_not_passed(self):
-        with mock.patch(self.IGW+'addDuplicateWidget') as mock_dupl_call:
+        with mock.patch.object(IGW_CLS, 'addDuplicateWidget') as mock_dupl:
             imagegroupwidget.ImageGroupWidget(self.conf)
 
-        mock_dupl_call.assert_not_called()
+        mock_dupl.assert_not_called()
 
 
 class TestImageGroupWidgetMethodAddDuplicateWidget(TestImageGroupWidget):
 
-    DW = 'myfyrio.gui.duplicatewidget.DuplicateWidget'
-
     def setUp(self):
         super().setUp()
 
         self.conf['lazy'] = True
 
-        self.w._layout = mock.Mock(spec=QtWidgets.QHBoxLayout)
+        self.w._layout = mock.Mock(spec=HBOX_LAYOUT_SPEC)
+
+        self.mock_duplW = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
+
+        patcher = mock.patch.object(duplicatewidget, 'DuplicateWidget',
+                                    return_value=self.mock_duplW)
+        self.mock_duplW_call = patcher.start()
+        self.addCleanup(patcher.stop)
 
-        self.mock_duplW = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        patcher = mock.patch.object(IGW_CLS, '_insertIndex',
+                                    return_value=0)
+        self.mock_insert_call = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_DuplicateWidget_called_with_image_and_conf_args(self):
-        with mock.patch(self.DW,
-                        return_value=self.mock_duplW) as mock_duplW_call:
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
+        self.w.addDuplicateWidget(self.mock_image)
 
-        mock_duplW_call.assert_called_once_with(self.mock_image, self.conf)
+        self.mock_duplW_call.assert_called_once_with(self.mock_image,
+                                                     self.conf)
 
     def test_duplW_error_signal_connected_if_duplW_is_not_selected(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
+        self.w.addDuplicateWidget(self.mock_image)
 
         self.mock_duplW.error.connect.assert_called_once()
 
     def test_duplW_hidden_signal_connected_if_duplW_is_not_selected(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
+        self.w.addDuplicateWidget(self.mock_image)
 
         self.mock_duplW.hidden.connect.assert_called_once_with(
             self.w._duplicateWidgetHidden
         )
 
-    def test_DuplicateWidget_added_to_attr_widgets(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
-
-        self.assertListEqual(self.w.widgets, [self.mock_duplW])
-
-    def test_insertIndex_called_with_new_DuplicateWidget(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex',
-                            return_value=0) as mock_insert_call:
-                self.w.addDuplicateWidget(self.mock_image)
-
-        mock_insert_call.assert_called_once_with(self.mock_duplW)
-
-    def test_DuplicateWidget_inserted_to_layout(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
-
-        self.w._layout.insertWidget.assert_called_once_with(0, self.mock_duplW)
-
-    def test_inserted_DuplicateWidget_layout_alignment_set_to_AlignTop(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                self.w.addDuplicateWidget(self.mock_image)
-
-        self.w._layout.setAlignment.assert_called_once_with(
-            self.mock_duplW, QtCore.Qt.AlignTop
-        )
-
-    def test_added_DuplicateWidget_returned(self):
-        with mock.patch(self.DW, return_value=self.mock_duplW):
-            with mock.patch(self.IGW+'_insertIndex', return_value=0):
-                res = self.w.addDuplicateWidget(self.mock_image)
-
-        self.assertEqual(res, self.mock_duplW)
-
-
-class TestImageGroupWidgetMethodInsertIndex(TestImageGroupWidget):
+    def test_DuplicateWidget_inserted_to_widgets_and_layout_and_returned(
+            self
+    ):
+        res = self.w.addDuplicateWidget(self.mock_image)
+
+        # One call and a subtest per outcome, so each one is still
+        # reported on its own
+        with self.subTest('added to attr widgets'):
+            self.assertListEqual(self.w.widgets, [self.mock_duplW])
+        with self.subTest('_insertIndex called with new widget'):
+            self.mock_insert_call.assert_called_once_with(self.mock_duplW)
+        with self.subTest('inserted to layout'):
+            self.w._layout.insertWidget.assert_called_once_with(
+                0, self.mock_duplW
+            )
+        with self.subTest('layout alignment set to AlignTop'):
+            self.w._layout.setAlignment.assert_called_once_with(
+                self.mock_duplW, QtCore.Qt.AlignTop
+            )
+        with self.subTest('returned'):
+            self.assertEqual(res, self.mock_duplW)
+
+
+class TestImageGroupWidgetMethodInsertIndex(TestImageGroupWidgetNoQt):
 
     def setUp(self):
         super().setUp()
@@ -164,19 +182,17 @@ class TestImageGroupWidgetMethodInsertIndex(TestImageGroupWidget):
         self.mock_Sort = mock.Mock(spec=core.Sort)
         self.mock_Sort.key.return_value = lambda x: x
 
-        self.mock_new_duplW = mock.Mock()
-        self.mock_new_duplW.image = 888
+        # '_insertIndex' only reads the widgets' images
+        self.mock_new_duplW = SimpleNamespace(image=888)
 
-        self.mock_duplW1 = mock.Mock()
-        self.mock_duplW1.image = 1
-        self.mock_duplW2 = mock.Mock()
-        self.mock_duplW2.image = 2
+        self.mock_duplW1 = SimpleNamespace(image=1)
+        self.mock_duplW2 = SimpleNamespace(image=2)
 
         self.w.widgets = [self.mock_duplW1, self.mock_duplW2]
 
     def test_Sort_key_called_with_proper_sort_type_from_conf(self):
-        with mock.patch('myfyrio.core.Sort',
-                        return_value=self.mock_Sort) as mock_Sort_call:
+        with mock.patch.object(core, 'Sort',
+                               return_value=self.mock_Sort) as mock_Sort_call:
             self.w._insertIndex(self.mock_new_duplW)
 
         mock_Sort_call.assert_called_once_with(0)
@@ -184,56 +200,52 @@ class TestImageGroupWidgetMethodInsertIndex(TestImageGroupWidget):
 
     def test_new_widget_inserted_in_beginning(self):
         self.mock_new_duplW.image = 0
-        with mock.patch('myfyrio.core.Sort', return_value=self.mock_Sort):
+        with mock.patch.object(core, 'Sort', return_value=self.mock_Sort):
             res = self.w._insertIndex(self.mock_new_duplW)
 
         self.assertEqual(res, 0)
 
     def test_new_widget_inserted_in_middle(self):
         self.mock_new_duplW.image = 1.5
-        with mock.patch('myfyrio.core.Sort', return_value=self.mock_Sort):
+        with mock.patch.object(core, 'Sort', return_value=self.mock_Sort):
             res = self.w._insertIndex(self.mock_new_duplW)
 
         self.assertEqual(res, 1)
 
     def test_new_widget_inserted_in_end(self):
         self.mock_new_duplW.image = 3
-        with mock.patch('myfyrio.core.Sort', return_value=self.mock_Sort):
+        with mock.patch.object(core, 'Sort', return_value=self.mock_Sort):
             res = self.w._insertIndex(self.mock_new_duplW)
 
         self.assertEqual(res, 2)
 
 
-class TestImageGroupWidgetMethodHasSelected(TestImageGroupWidget):
+class TestImageGroupWidgetMethodHasSelected(TestImageGroupWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
-        self.mock_duplW = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.w.widgets = [self.mock_duplW]
 
-    def test_return_True_if_duplicate_widget_is_selected(self):
-        self.mock_duplW.selected = True
-        res = self.w.hasSelected()
-
-        self.assertTrue(res)
-
-    def test_return_False_if_duplicate_widget_is_not_selected(self):
-        self.mock_duplW.selected = False
-        res = self.w.hasSelected()
+    def test_return_duplicate_widget_selected_state(self):
+        for selected in (True, False):
+            with self.subTest(selected=selected):
+                self.mock_duplW.selected = selected
+                res = self.w.hasSelected()
 
-        self.assertFalse(res)
+                self.assertIs(res, selected)
 
 
-class TestImageGroupWidgetMethodAutoSelect(TestImageGroupWidget):
+class TestImageGroupWidgetMethodAutoSelect(TestImageGroupWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
-        self.mock_duplW0 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW0 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_selected_prop0 = mock.PropertyMock(spec=bool)
         type(self.mock_duplW0).selected = self.mock_selected_prop0
-        self.mock_duplW1 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW1 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_selected_prop1 = mock.PropertyMock(spec=bool)
         type(self.mock_duplW1).selected = self.mock_selected_prop1
         self.w.widgets = [self.mock_duplW0, self.mock_duplW1]
@@ -249,15 +261,15 @@ class TestImageGroupWidgetMethodAutoSelect(TestImageGroupWidget):
         self.mock_selected_prop0.assert_not_called()
 
 
-class TestImageGroupWidgetMethodUnselect(TestImageGroupWidget):
+class TestImageGroupWidgetMethodUnselect(TestImageGroupWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
-        self.mock_duplW0 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW0 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_selected_prop0 = mock.PropertyMock(spec=bool)
         type(self.mock_duplW0).selected = self.mock_selected_prop0
-        self.mock_duplW1 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW1 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_selected_prop1 = mock.PropertyMock(spec=bool)
         type(self.mock_duplW1).selected = self.mock_selected_prop1
         self.w.widgets = [self.mock_duplW0, self.mock_duplW1]
@@ -269,12 +281,12 @@ class TestImageGroupWidgetMethodUnselect(TestImageGroupWidget):
         self.mock_selected_prop1.assert_called_once_with(False)
 
 
-class TestImageGroupWidgetMethodCallOnSelected(TestImageGroupWidget):
+class TestImageGroupWidgetMethodCallOnSelected(TestImageGroupWidgetNoQt):
 
     def setUp(self):
         super().setUp()
 
-        self.mock_duplW = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        self.mock_duplW = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.w.widgets = [self.mock_duplW]
         self.w._visible_num = 5
 
@@ -282,41 +294,41 @@ class TestImageGroupWidgetMethodCallOnSelected(TestImageGroupWidget):
         self.arg = 'arg'
         self.kwarg = 'kwarg'
 
-    def test_passed_func_not_called_if_duplicate_widget_is_not_selected(self):
-        self.mock_duplW.selected = False
-        self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
-
-        self.func.assert_not_called()
-
-    def test_passed_func_called_if_duplicate_widget_is_selected(self):
-        self.mock_duplW.selected = True
-        self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
-
-        self.func.assert_called_once_with(
-            self.mock_duplW, self.arg, kwarg=self.kwarg
-        )
-
-    def test_hide_not_called_if_attr_visible_num_more_than_1(self):
-        self.mock_duplW.selected = False
-        self.w._visible_num = 2
-        with mock.patch(self.IGW+'hide') as mock_hide_call:
-            self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
-
-        mock_hide_call.assert_not_called()
-
-    def test_hide_called_if_attr_visible_num_less_than_2(self):
+    def test_passed_func_called_only_if_duplicate_widget_is_selected(self):
+        for selected in (False, True):
+            with self.subTest(selected=selected):
+                self.func.reset_mock()
+                self.mock_duplW.selected = selected
+                self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
+
+                if selected:
+                    self.func.assert_called_once_with(
+                        self.mock_duplW, self.arg, kwarg=self.kwarg
+                    )
+                else:
+                    self.func.assert_not_called()
+
+    @mock.patch.object(IGW_CLS, 'hide')
+    def test_hide_called_only_if_attr_visible_num_less_than_2(
+            self, mock_hide_call
+    ):
         self.mock_duplW.selected = False
-        self.w._visible_num = 1
-        with mock.patch(self.IGW+'hide') as mock_hide_call:
-            self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
+        for visible_num, hidden in ((2, False), (1, True)):
+            with self.subTest(visible_num=visible_num):
+                mock_hide_call.reset_mock()
+                self.w._visible_num = visible_num
+                self.w._callOnSelected(self.func, self.arg, kwarg=self.kwarg)
 
-        mock_hide_call.assert_called_once_with()
+                if hidden:
+                    mock_hide_call.assert_called_once_with()
+                else:
+                    mock_hide_call.assert_not_called()
 
 
-class TestImageGroupWidgetMethodDelete(TestImageGroupWidget):
+class TestImageGroupWidgetMethodDelete(TestImageGroupWidgetNoQt):
 
     def test_callOnSelected_called_with_DuplicateWidget_delete_func_arg(self):
-        with mock.patch(self.IGW+'_callOnSelected') as mock_call:
+        with mock.patch.object(IGW_CLS, '_callOnSelected') as mock_call:
             self.w.delete()
 
         mock_call.assert_called_once_with(
@@ -324,10 +336,10 @@ class TestImageGroupWidgetMethodDelete(TestImageGroupWidget):
         )
 
 
-class TestImageGroupWidgetMethodMove(TestImageGroupWidget):
+class TestImageGroupWidgetMethodMove(TestImageGroupWidgetNoQt):
 
     def test_callOnSelected_called_with_DuplicateWidget_move_func__dst(self):
-        with mock.patch(self.IGW+'_callOnSelected') as mock_call:
+        with mock.patch.object(IGW_CLS, '_callOnSelected') as mock_call:
             self.w.move('new_folder')
 
         mock_call.assert_called_once_with(
@@ -17,41 +17,53 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
 
-import logging
 from unittest import TestCase, mock
 
-from PyQt5 import QtCore, QtTest, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
-from myfyrio.gui import duplicatewidget, imagegroupwidget, imageviewwidget
+from myfyrio.gui import (duplicatewidget, errornotifier, imagegroupwidget,
+                         imageviewwidget)
+from tests import _qapp, helpers
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+IVW_CLS = imageviewwidget.ImageViewWidget
 
-VIEW_MODULE = 'myfyrio.gui.imageviewwidget.'
+DUPLICATE_WIDGET_SPEC = helpers.specOf(duplicatewidget.DuplicateWidget)
+IMAGE_GROUP_WIDGET_SPEC = helpers.specOf(imagegroupwidget.ImageGroupWidget)
+QVBOX_LAYOUT_SPEC = helpers.specOf(QtWidgets.QVBoxLayout)
 
 # pylint: disable=missing-class-docstring
 
 
 class TestImageViewWidget(TestCase):
 
-    IVW = VIEW_MODULE + 'ImageViewWidget.'
+    # Every test class gets one widget. The attributes the tests change are
+    # put back in 'setUp' and the slots they connect are disconnected after
+    # them, so the widget is as good as a new one
+    @classmethod
+    def setUpClass(cls):
+        cls.w = imageviewwidget.ImageViewWidget({})
+        cls.layout = cls.w._layout
 
     def setUp(self):
         self.conf = {'param': 'val'}
 
-        self.w = imageviewwidget.ImageViewWidget(self.conf)
+        self.w._conf = self.conf
+        self.w.widgets = []
+        self.w._errors = []
+        self.w._layout = self.layout
+
 
+class TestImageViewWidgetMethodInit(TestCase):
 
-class TestImageViewWidgetMethodInit(TestImageViewWidget):
+    # The tests only read the state '__init__' leaves, so they share a widget
+    @classmethod
+    def setUpClass(cls):
+        cls.conf = {'param': 'val'}
+
+        cls.w = imageviewwidget.ImageViewWidget(cls.conf)
 
     def test_default_values(self):
         self.assertEqual(self.w._conf, self.conf)
@@ -59,11 +71,9 @@ class TestImageViewWidgetMethodInit(TestImageViewWidget):
         self.assertListEqual(self.w._errors, [])
 
     def test_layout(self):
-        margins = self.w._layout.contentsMargins()
-        self.assertEqual(margins.top(), 9)
-        self.assertEqual(margins.right(), 9)
-        self.assertEqual(margins.bottom(), 9)
-        self.assertEqual(margins.left(), 9)
+        m = self.w._layout.contentsMargins()
+        margins = (m.top(), m.right(), m.bottom(), m.left())
+        self.assertTupleEqual(margins, (9, 9, 9, 9))
 
         self.assertEqual(self.w._layout.spacing(), 10)
         self.assertIsInstance(self.w._layout, QtWidgets.QVBoxLayout)
@@ -80,46 +90,50 @@ class TestImageViewWidgetMethodAddGroup(TestImageViewWidget):
 
         self.image_group = (0, ['image'])
         self.empty_image_group = (0, [])
+        self.error_records = helpers.captureErrors(
+            self, 'main.imageviewwidget'
+        )
 
     def test_render_called_if_image_groups_found(self):
-        with mock.patch(self.IVW+'_render') as mock_render_call:
+        with mock.patch.object(IVW_CLS, '_render') as mock_render_call:
             self.w.addGroup(self.image_group)
 
         mock_render_call.assert_called_once_with(self.image_group)
 
     def test_logging_if_render_raise_Exception(self):
-        with mock.patch(self.IVW+'_render', side_effect=Exception):
-            with self.assertLogs('main.imageviewwidget', 'ERROR'):
-                self.w.addGroup(self.image_group)
+        with mock.patch.object(IVW_CLS, '_render', side_effect=Exception):
+            self.w.addGroup(self.image_group)
+
+        self.assertTrue(self.error_records)
 
     def test_emit_error_signal_with_err_msg_if_render_raise_Exception(self):
-        spy = QtTest.QSignalSpy(self.w.error)
-        with mock.patch(self.IVW+'_render', side_effect=Exception('Error')):
+        mock_slot = helpers.connectMockSlot(self, self.w.error)
+        with mock.patch.object(IVW_CLS, '_render',
+                               side_effect=Exception('Error')):
             self.w.addGroup(self.image_group)
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 'Error')
+        mock_slot.assert_called_once_with('Error')
 
     def test_emit_interrupted_signal_if_render_raise_Exception(self):
-        spy = QtTest.QSignalSpy(self.w.interrupted)
-        with mock.patch(self.IVW+'_render', side_effect=Exception):
+        mock_slot = helpers.connectMockSlot(self, self.w.interrupted)
+        with mock.patch.object(IVW_CLS, '_render', side_effect=Exception):
             self.w.addGroup(self.image_group)
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_render_not_called_if_empty_image_groups(self):
-        with mock.patch(self.IVW+'_render') as mock_render_call:
+        with mock.patch.object(IVW_CLS, '_render') as mock_render_call:
             self.w.addGroup(self.empty_image_group)
 
         mock_render_call.assert_not_called()
 
     def test_finished_signal_emitted_ifempty__image_group(self):
-        spy = QtTest.QSignalSpy(self.w.finished)
+        mock_slot = helpers.connectMockSlot(self, self.w.finished)
         self.w.addGroup(self.empty_image_group)
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
-    @mock.patch('PyQt5.QtWidgets.QMessageBox')
+    @mock.patch.object(QtWidgets, 'QMessageBox')
     def test_QMessageBox_not_called_if_empty_image_group__no_widgets(self,
                                                                      mock_box):
         self.w.widgets = []
@@ -127,7 +141,7 @@ class TestImageViewWidgetMethodAddGroup(TestImageViewWidget):
 
         mock_box.assert_called_once()
 
-    @mock.patch('PyQt5.QtWidgets.QMessageBox')
+    @mock.patch.object(QtWidgets, 'QMessageBox')
     def test_QMessageBox_called_if_empty_image_group__widgets_found(self,
                                                                     mock_box):
 
@@ -138,59 +152,56 @@ class TestImageViewWidgetMethodAddGroup(TestImageViewWidget):
 
 class TestImageViewWidgetMethodRender(TestImageViewWidget):
 
-    IGW = 'myfyrio.gui.imagegroupwidget.ImageGroupWidget'
-
     def setUp(self):
         super().setUp()
 
-        self.w._layout = mock.Mock(spec=QtWidgets.QVBoxLayout)
+        self.w._layout = mock.Mock(spec=QVBOX_LAYOUT_SPEC)
 
         self.image_group = (0, ['image1', 'image2'])
-        self.mock_groupW = mock.Mock(spec=imagegroupwidget.ImageGroupWidget)
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.mock_groupW.widgets = []
 
+        patcher = mock.patch.object(imagegroupwidget, 'ImageGroupWidget',
+                                    return_value=self.mock_groupW)
+        self.mock_groupW_call = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_call_ImageGroupWidget_with_conf_arg_if_new_group(self):
-        with mock.patch(self.IGW, return_value=self.mock_groupW) as mock_widg:
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
-        mock_widg.assert_called_once_with(self.conf)
+        self.mock_groupW_call.assert_called_once_with(self.conf)
 
     def test_ImageGroupWidget_error_connect_to_attr_errors_append_if_new(self):
-        with mock.patch(self.IGW, return_value=self.mock_groupW):
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
         self.mock_groupW.error.connect(self.w._errors.append)
 
     def test_ImageGroupWidget_added_to_layout_if_new_group(self):
-        with mock.patch(self.IGW, return_value=self.mock_groupW):
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
         self.w._layout.addWidget.assert_called_once_with(self.mock_groupW)
 
     def test_ImageGroupWidget_added_to_attr_widgets_if_new_group(self):
-        with mock.patch(self.IGW, return_value=self.mock_groupW):
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
         self.assertListEqual(self.w.widgets, [self.mock_groupW])
 
     def test_new_DuplicateWidgets_added_if_new_group(self):
-        mock_duplW1 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
-        mock_duplW2 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        mock_duplW1 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
+        mock_duplW2 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_groupW.addDuplicateWidget.side_effect = [mock_duplW1,
                                                            mock_duplW2]
-        with mock.patch(self.IGW, return_value=self.mock_groupW):
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
         calls = [mock.call('image1'), mock.call('image2')]
         self.mock_groupW.addDuplicateWidget.assert_has_calls(calls)
 
     def test_new_DuplicateWidgets_connected_to_hasSelected_if_new_group(self):
-        mock_duplW1 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
-        mock_duplW2 = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        mock_duplW1 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
+        mock_duplW2 = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_groupW.addDuplicateWidget.side_effect = [mock_duplW1,
                                                            mock_duplW2]
-        with mock.patch(self.IGW, return_value=self.mock_groupW):
-            self.w._render(self.image_group)
+        self.w._render(self.image_group)
 
         mock_duplW1.clicked.connect.assert_called_once_with(
             self.w._hasSelected
@@ -209,7 +220,7 @@ class TestImageViewWidgetMethodRender(TestImageViewWidget):
     def test_new_DuplicateWidget_connected_to_hasSelected_if_existing(self):
         self.w.widgets = [self.mock_groupW]
         self.image_group[1].append('image3')
-        mock_duplW = mock.Mock(spec=duplicatewidget.DuplicateWidget)
+        mock_duplW = mock.NonCallableMock(spec=DUPLICATE_WIDGET_SPEC)
         self.mock_groupW.addDuplicateWidget.return_value = mock_duplW
         self.w._render(self.image_group)
 
@@ -223,24 +234,22 @@ class TestImageViewWidgetMethodHasSelected(TestImageViewWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_groupW = mock.Mock(spec=imagegroupwidget.ImageGroupWidget)
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.w.widgets = [self.mock_groupW]
 
     def test_selected_signal_with_True_emitted_if_there_are_selected(self):
         self.mock_groupW.hasSelected.return_value = True
-        spy = QtTest.QSignalSpy(self.w.selected)
+        mock_slot = helpers.connectMockSlot(self, self.w.selected)
         self.w._hasSelected()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTrue(spy[0][0])
+        mock_slot.assert_called_once_with(True)
 
     def test_selected_signal_with_False_emitted_if_there_are_no_selected(self):
         self.mock_groupW.hasSelected.return_value = False
-        spy = QtTest.QSignalSpy(self.w.selected)
+        mock_slot = helpers.connectMockSlot(self, self.w.selected)
         self.w._hasSelected()
 
-        self.assertEqual(len(spy), 1)
-        self.assertFalse(spy[0][0])
+        mock_slot.assert_called_once_with(False)
 
 
 class TestImageViewWidgetMethodClear(TestImageViewWidget):
@@ -248,24 +257,27 @@ class TestImageViewWidgetMethodClear(TestImageViewWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_groupW = mock.Mock()
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.w.widgets = [self.mock_groupW]
 
+        # Patched for every test, so the real global thread pool is not
+        # waited for even by the tests that do not check it
+        patcher = mock.patch.object(
+            QtCore.QThreadPool, 'globalInstance',
+            return_value=mock.Mock(spec_set=['clear', 'waitForDone'])
+        )
+        self.mock_threadpool = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
     def test_threadpool_clear_called(self):
-        threadpool = mock.Mock(spec=QtCore.QThreadPool)
-        with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance',
-                        return_value=threadpool):
-            self.w.clear()
+        self.w.clear()
 
-        threadpool.clear.assert_called_once_with()
+        self.mock_threadpool.clear.assert_called_once_with()
 
     def test_threadpool_waitForDone_called(self):
-        threadpool = mock.Mock(spec=QtCore.QThreadPool)
-        with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance',
-                        return_value=threadpool):
-            self.w.clear()
+        self.w.clear()
 
-        threadpool.waitForDone.assert_called_once_with()
+        self.mock_threadpool.waitForDone.assert_called_once_with()
 
     def test_deleteLater_called(self):
         self.w.clear()
@@ -280,12 +292,10 @@ class TestImageViewWidgetMethodClear(TestImageViewWidget):
 
 class TestImageViewWidgetMethodCallOnSelected(TestImageViewWidget):
 
-    PATCH_ERRN = 'myfyrio.gui.errornotifier.'
-
     def setUp(self):
         super().setUp()
 
-        self.mock_groupW = mock.Mock(spec=imagegroupwidget.ImageGroupWidget)
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.w.widgets = [self.mock_groupW]
 
         self.mock_func = mock.Mock()
@@ -301,7 +311,7 @@ class TestImageViewWidgetMethodCallOnSelected(TestImageViewWidget):
 
     def test_errorMessage_called_with_attr_errors_arg(self):
         self.w._errors = ['Error']
-        with mock.patch(self.PATCH_ERRN+'errorMessage') as mock_err_call:
+        with mock.patch.object(errornotifier, 'errorMessage') as mock_err_call:
             self.w._callOnSelected(self.mock_func, self.args,
                                    kwarg=self.kwargs)
 
@@ -309,59 +319,78 @@ class TestImageViewWidgetMethodCallOnSelected(TestImageViewWidget):
 
     def test_attr_errors_cleared(self):
         self.w._errors = ['Error']
-        with mock.patch(self.PATCH_ERRN+'errorMessage'):
+        with mock.patch.object(errornotifier, 'errorMessage'):
             self.w._callOnSelected(self.mock_func, self.args,
                                    kwarg=self.kwargs)
 
         self.assertListEqual(self.w._errors, [])
 
 
-class TestImageViewWidgetMethodDelete(TestImageViewWidget):
+class TestImageViewWidgetSelectedAction(TestImageViewWidget):
+
+    # For the actions on the selected images ('delete', 'move'). They only
+    # ask the user and pass the work on to '_callOnSelected'
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.object(IVW_CLS, '_callOnSelected')
+        self.mock_callOnSelected = patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestImageViewWidgetMethodDelete(TestImageViewWidgetSelectedAction):
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.object(QtWidgets.QMessageBox, 'question')
+        self.mock_question = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_callOnSelected_called_if_QMessageBox_return_Yes(self):
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            with mock.patch(self.IVW+'_callOnSelected') as mock_call_call:
-                self.w.delete()
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+        self.w.delete()
 
-        mock_call_call.assert_called_once_with(
+        self.mock_callOnSelected.assert_called_once_with(
             imagegroupwidget.ImageGroupWidget.delete
         )
 
     def test_callOnSelected_not_called_if_QMessageBox_return_Cancel(self):
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            with mock.patch(self.IVW+'_callOnSelected') as mock_call_call:
-                self.w.delete()
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
+        self.w.delete()
 
-        mock_call_call.assert_not_called()
+        self.mock_callOnSelected.assert_not_called()
 
 
-class TestImageViewWidgetMethodMove(TestImageViewWidget):
+class TestImageViewWidgetMethodMove(TestImageViewWidgetSelectedAction):
 
     def setUp(self):
         super().setUp()
 
-        self.mock_dialog = mock.Mock(spec=QtWidgets.QFileDialog)
+        # The dialog methods 'move' calls, a much shorter spec than the
+        # names of the whole QFileDialog class
+        self.mock_dialog = mock.Mock(
+            spec_set=['setFileMode', 'setOptions', 'exec', 'selectedFiles']
+        )
+
+        patcher = mock.patch.object(QtWidgets, 'QFileDialog',
+                                    return_value=self.mock_dialog)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_callOnSelected_not_called_if_dialog_not_return_new_folder(self):
         self.mock_dialog.exec.return_value = False
-        with mock.patch('PyQt5.QtWidgets.QFileDialog',
-                        return_value=self.mock_dialog):
-            with mock.patch(self.IVW+'_callOnSelected') as mock_call_call:
-                self.w.move()
+        self.w.move()
 
-        mock_call_call.assert_not_called()
+        self.mock_callOnSelected.assert_not_called()
 
     def test_callOnSelected_called_with_new_dst_if_dialog_return_new_dst(self):
         self.mock_dialog.exec.return_value = True
         self.mock_dialog.selectedFiles.return_value = ['new_folder']
-        with mock.patch('PyQt5.QtWidgets.QFileDialog',
-                        return_value=self.mock_dialog):
-            with mock.patch(self.IVW+'_callOnSelected') as mock_call_call:
-                self.w.move()
+        self.w.move()
 
-        mock_call_call.assert_called_once_with(
+        self.mock_callOnSelected.assert_called_once_with(
             imagegroupwidget.ImageGroupWidget.move,
             'new_folder'
         )
@@ -372,7 +401,7 @@ class TestImageViewWidgetMethodAutoSelect(TestImageViewWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_groupW = mock.Mock(spec=imagegroupwidget.ImageGroupWidget)
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.w.widgets = [self.mock_groupW]
 
     def test_ImageGroupWidget_autoSelect_called(self):
@@ -386,7 +415,7 @@ class TestImageViewWidgetMethodUnselect(TestImageViewWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_groupW = mock.Mock(spec=imagegroupwidget.ImageGroupWidget)
+        self.mock_groupW = mock.NonCallableMock(spec=IMAGE_GROUP_WIDGET_SPEC)
         self.w.widgets = [self.mock_groupW]
 
     def test_ImageGroupWidget_unselect_called(self):
@@ -19,14 +19,13 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtCore
 
 from myfyrio.gui import infolabel
+from tests import _qapp
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 IL_MODULE = 'myfyrio.gui.infolabel.'
 
@@ -35,22 +34,30 @@ IL_MODULE = 'myfyrio.gui.infolabel.'
 
 class TestInfoLabel(TestCase):
 
-    def setUp(self):
-        self.text = 'text'
-        self.width = 200
-        self.w = infolabel.InfoLabel(self.text, self.width)
+    # The tests patch out everything that would change the label, so one
+    # label per class is enough
+    @classmethod
+    def setUpClass(cls):
+        cls.text = 'text'
+        cls.width = 200
+        cls.w = infolabel.InfoLabel(cls.text, cls.width)
 
 
-class TestInfoLabelMethodInit(TestInfoLabel):
+class TestInfoLabelMethodInit(TestCase):
 
-    def test_init_values(self):
-        self.assertEqual(self.w.widget_width, self.width)
-
-    def test_alignment_is_AlignHCenter(self):
-        self.assertEqual(self.w.alignment(), QtCore.Qt.AlignHCenter)
+    # SimilarityLabel adds nothing to InfoLabel's '__init__', so both are
+    # checked by the same test, one label of each class
+    LABEL_CLASSES = (infolabel.InfoLabel, infolabel.SimilarityLabel)
 
-    def test_text_is_set(self):
-        self.assertEqual(self.w.text(), self.text)
+    def test_init_values(self):
+        text, width = 'text', 200
+        for label_class in self.LABEL_CLASSES:
+            with self.subTest(label_class=label_class.__name__):
+                w = label_class(text, width)
+
+                self.assertEqual(w.widget_width, width)
+                self.assertEqual(w.alignment(), QtCore.Qt.AlignHCenter)
+                self.assertEqual(w.text(), text)
 
 
 class TestInfoLabelMethodSetText(TestInfoLabel):
@@ -16,7 +16,6 @@ You should have received a copy of the GNU General Public License
 along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-import logging
 import pathlib
 import sys
 from subprocess import CalledProcessError
@@ -24,13 +23,6 @@ from unittest import TestCase, mock
 
 from myfyrio.gui import licensinglabel
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
-
 
 # pylint: disable=missing-class-docstring
 
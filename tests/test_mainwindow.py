@@ -18,17 +18,20 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtCore, QtTest, QtWidgets
+import pytest
+from PyQt5 import QtCore, QtWidgets
 
-from myfyrio import workers
-from myfyrio.gui import (aboutwindow, imageviewwidget, mainwindow,
-                         pathslistwidget, preferenceswindow, pushbutton,
-                         sensitivityradiobutton)
+from myfyrio import config, workers
+from myfyrio.gui import (aboutwindow, errornotifier, imageviewwidget,
+                         mainwindow, pathslistwidget, preferenceswindow,
+                         pushbutton, sensitivityradiobutton)
+from tests import _qapp, helpers
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
+
+# The windows are built from the .ui files
+pytestmark = pytest.mark.slow
 
 # pylint: disable=missing-class-docstring
 
@@ -37,7 +40,23 @@ class TestMainWindow(TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.mw = mainwindow.MainWindow()
+        # The preferences window starts with the default config instead of
+        # reading the one on the disk
+        default_conf = config.Config()
+        default_conf._default()
+        with mock.patch.object(preferenceswindow.PreferencesWindow,
+                               '_load_config', return_value=default_conf):
+            cls.mw = mainwindow.MainWindow()
+
+
+class TestMainWindowStub(TestCase):
+
+    # For the methods that only wire the signals of the window's widgets.
+    # They are called unbound on a stub, so no window is built from the .ui
+    # file (the widgets are attributes set by 'uic.loadUi', hence no spec)
+
+    def setUp(self):
+        self.mw = mock.Mock()
 
 
 class TestMainWindowMethodInit(TestMainWindow):
@@ -48,10 +67,10 @@ class TestMainWindowMethodInit(TestMainWindow):
                               preferenceswindow.PreferencesWindow)
         self.assertListEqual(self.mw._errors, [])
         self.assertIsInstance(self.mw.threadpool, QtCore.QThreadPool)
-        self.assertEqual(self.mw.verticalLayout.contentsMargins().top(), 9)
-        self.assertEqual(self.mw.verticalLayout.contentsMargins().bottom(), 9)
-        self.assertEqual(self.mw.verticalLayout.contentsMargins().right(), 9)
-        self.assertEqual(self.mw.verticalLayout.contentsMargins().left(), 9)
+
+        m = self.mw.verticalLayout.contentsMargins()
+        margins = (m.top(), m.right(), m.bottom(), m.left())
+        self.assertTupleEqual(margins, (9, 9, 9, 9))
 
     def test_enabled_by_default_actions(self):
         self.assertTrue(self.mw.addFolderAction.isEnabled())
@@ -89,54 +108,51 @@ class TestMainWindowMethodInit(TestMainWindow):
         self.assertEqual(self.mw.processProg.value(), 0)
 
     def test_processing_labels_numbers_are_0_by_default(self):
-        self.assertEqual(self.mw.loadedPicLbl.text()[-2:], ' 0')
-        self.assertEqual(self.mw.foundInCacheLbl.text()[-2:], ' 0')
-        self.assertEqual(self.mw.calculatedLbl.text()[-2:], ' 0')
-        self.assertEqual(self.mw.duplicatesLbl.text()[-2:], ' 0')
-        self.assertEqual(self.mw.groupsLbl.text()[-2:], ' 0')
+        labels = (self.mw.loadedPicLbl, self.mw.foundInCacheLbl,
+                  self.mw.calculatedLbl, self.mw.duplicatesLbl,
+                  self.mw.groupsLbl)
+        numbers = [label.text().rpartition(' ')[2] for label in labels]
 
+        self.assertListEqual(numbers, ['0'] * len(labels))
 
-class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
 
-    PACTH_IVW = 'myfyrio.gui.imageviewwidget.ImageViewWidget'
-    PATCH_ERRN = 'myfyrio.gui.errornotifier.'
+class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
 
     def setUp(self):
         self.mw.scrollArea = mock.Mock(spec=QtWidgets.QScrollArea)
 
         self.mock_IVW = mock.Mock(spec=imageviewwidget.ImageViewWidget)
+        patcher = mock.patch.object(imageviewwidget, 'ImageViewWidget',
+                                    return_value=self.mock_IVW)
+        self.mock_IVW_call = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_ImageViewWidget_called_with_conf_and_parent_args(self):
-        with mock.patch(self.PACTH_IVW) as mock_IVW_call:
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
-        mock_IVW_call.assert_called_once_with(
+        self.mock_IVW_call.assert_called_once_with(
             self.mw.preferencesWindow.conf, self.mw
         )
 
     def test_finished_signal_connected_to_6_slots(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         self.assertEqual(len(self.mock_IVW.finished.connect.call_args_list), 6)
 
     def test_finished_signal_connected_to_processProg_setMaxValue(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.processProg.setMaxValue)]
         self.mock_IVW.finished.connect.assert_has_calls(calls)
 
     def test_finished_signal_connected_to_stopBtn_disable(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.stopBtn.disable)]
         self.mock_IVW.finished.connect.assert_has_calls(calls)
 
     def test_finished_signal_connected_to_startBtn_finished(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.startBtn.finished)]
         self.mock_IVW.finished.connect.assert_has_calls(calls)
@@ -144,8 +160,7 @@ class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
     def test_finished_signal_connected_to_autoSelectBtn_enable(self):
         self.mock_IVW.widgets = ['widget']
         self.mw.autoSelectBtn.setEnabled(False)
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         call_args_list = self.mock_IVW.finished.connect.call_args_list
         f = call_args_list[3][0][0]
@@ -156,8 +171,7 @@ class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
     def test_finished_signal_connected_to_autoSelectBtn_disable(self):
         self.mock_IVW.widgets = []
         self.mw.autoSelectBtn.setEnabled(True)
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         call_args_list = self.mock_IVW.finished.connect.call_args_list
         f = call_args_list[3][0][0]
@@ -168,8 +182,7 @@ class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
     def test_finished_connected_to_menubar_disableAutoSelectAction(self):
         self.mock_IVW.widgets = ['widget']
         self.mw.autoSelectAction.setEnabled(False)
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         call_args_list = self.mock_IVW.finished.connect.call_args_list
         f = call_args_list[4][0][0]
@@ -180,8 +193,7 @@ class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
     def test_finished_signal_connected_to_menubar_enableAutoSelectAction(self):
         self.mock_IVW.widgets = []
         self.mw.autoSelectAction.setEnabled(True)
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         call_args_list = self.mock_IVW.finished.connect.call_args_list
         f = call_args_list[4][0][0]
@@ -191,78 +203,71 @@ class TestMainWindowMethodSetImageViewWidget(TestMainWindow):
 
     def test_finished_signal_connected_to_errorMessage(self):
         self.mw._errors = ['error']
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         call_args_list = self.mock_IVW.finished.connect.call_args_list
         f = call_args_list[5][0][0]
-        with mock.patch(self.PATCH_ERRN+'errorMessage') as mock_err_call:
+        with mock.patch.object(errornotifier, 'errorMessage') as mock_err_call:
             f()
 
         mock_err_call.assert_called_once_with(['error'])
 
     def test_error_signal_connected_to_attr_errors_append_method(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         self.mock_IVW.error.connect.assert_called_once_with(
             self.mw._errors.append
         )
 
     def test_test_selected_signal_connected_to_6_slots(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         self.assertEqual(
             len(self.mock_IVW.selected.connect.call_args_list), 6
         )
 
     def test_selected_signal_connected_to_moveBtn_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.moveBtn.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
     def test_selected_signal_connected_to_deleteBtn_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.deleteBtn.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
     def test_selected_signal_connected_to_unselectBtn_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.unselectBtn.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
     def test_selected_signal_connected_to_moveAction_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.moveAction.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
     def test_selected_signal_connected_to_deleteAction_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.deleteAction.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
     def test_selected_signal_connected_to_unselectAction_setEnabled(self):
-        with mock.patch(self.PACTH_IVW, return_value=self.mock_IVW):
-            self.mw._setImageViewWidget()
+        self.mw._setImageViewWidget()
 
         calls = [mock.call(self.mw.unselectAction.setEnabled)]
         self.mock_IVW.selected.connect.assert_has_calls(calls)
 
 
-class TestMainWindowMethodSetFolderPathsGroupBox(TestMainWindow):
+class TestMainWindowMethodSetFolderPathsGroupBox(TestMainWindowStub):
 
     def setUp(self):
+        super().setUp()
+
         self.mock_paths = mock.Mock(spec=pathslistwidget.PathsListWidget)
         self.mock_addBtn = mock.Mock(spec=QtWidgets.QPushButton)
         self.mock_delBtn = mock.Mock(spec=QtWidgets.QPushButton)
@@ -272,39 +277,39 @@ class TestMainWindowMethodSetFolderPathsGroupBox(TestMainWindow):
         self.mw.delFolderBtn = self.mock_delBtn
 
     def test_pathsList_hasSelection_signal_connected_to_2_slots(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         self.assertEqual(
             len(self.mock_paths.hasSelection.connect.call_args_list), 2
         )
 
     def test_pathsList_hasSelection_connected_to_delFolderBtn_setEnabled(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         calls = [mock.call(self.mw.delFolderBtn.setEnabled)]
         self.mock_paths.hasSelection.connect.assert_has_calls(calls)
 
     def test_pathsList_hasSelection_connected_to_delFolderA_setEnabled(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         calls = [mock.call(self.mw.delFolderAction.setEnabled)]
         self.mock_paths.hasSelection.connect.assert_has_calls(calls)
 
     def test_pathsList_hasItems_signal_connected_to_startBtn_switch(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         self.mock_paths.hasItems.connect.assert_called_once_with(
             self.mw.startBtn.switch
         )
 
     def test_addFolderBtn_clicked_signal_connected_to_pathsList_addPath(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         calls = [mock.call(self.mw.pathsList.addPath)]
         self.mock_addBtn.clicked.connect.assert_has_calls(calls)
 
     def test_delFolderBtn_clicked_signal_connected_to_pathsList_delPath(self):
-        self.mw._setFolderPathsGroupBox()
+        mainwindow.MainWindow._setFolderPathsGroupBox(self.mw)
 
         calls = [mock.call(self.mw.pathsList.delPath)]
         self.mock_delBtn.clicked.connect.assert_has_calls(calls)
@@ -432,8 +437,6 @@ class TestMainWindowMethodSetImageProcessingGroupBox(TestMainWindow):
 
 class TestMainWindowMethodSetSensitivityGroupBox(TestMainWindow):
 
-    PATCH_SRB = 'myfyrio.gui.sensitivityradiobutton.'
-
     def setUp(self):
         self.mw.preferencesWindow = mock.Mock(
             spec=preferenceswindow.PreferencesWindow
@@ -442,11 +445,11 @@ class TestMainWindowMethodSetSensitivityGroupBox(TestMainWindow):
     def test_pW_setSensitivity_called_with_checkedRadioButton_res(self):
         mock_btn = mock.Mock(sensitivityradiobutton.SensitivityRadioButton)
         mock_btn.sensitivity = '69'
-        with mock.patch(self.PATCH_SRB+'checkedRadioButton',
-                        return_value=mock_btn) as mock_checked_call:
+        with mock.patch.object(sensitivityradiobutton, 'checkedRadioButton',
+                               return_value=mock_btn) as mock_checked_call:
             self.mw._setSensitivityGroupBox()
 
-        mock_checked_call.assert_called_once_with(self.mw)
+        mock_checked_call.assert_called_once_with(self.mw.sensGrp)
         self.mw.preferencesWindow.setSensitivity.assert_called_once_with(
             mock_btn.sensitivity
         )
@@ -497,11 +500,11 @@ class TestMainWindowMethodSetSensitivityGroupBox(TestMainWindow):
         )
 
 
-class TestMainWindowMethodSetActionsGroupBox(TestMainWindow):
+class TestMainWindowMethodSetActionsGroupBox(TestMainWindowStub):
 
     def test_moveBtn_clicked_signal_connected_to_imageViewWidget_move(self):
         self.mw.moveBtn = mock.Mock(spec=QtWidgets.QPushButton)
-        self.mw._setActionsGroupBox()
+        mainwindow.MainWindow._setActionsGroupBox(self.mw)
 
         self.mw.moveBtn.clicked.connect.assert_called_once_with(
             self.mw.imageViewWidget.move
@@ -509,7 +512,7 @@ class TestMainWindowMethodSetActionsGroupBox(TestMainWindow):
 
     def test_deleteBtn_clicked_connected_to_imageViewWidget_delete(self):
         self.mw.deleteBtn = mock.Mock(spec=QtWidgets.QPushButton)
-        self.mw._setActionsGroupBox()
+        mainwindow.MainWindow._setActionsGroupBox(self.mw)
 
         self.mw.deleteBtn.clicked.connect.assert_called_once_with(
             self.mw.imageViewWidget.delete
@@ -517,7 +520,7 @@ class TestMainWindowMethodSetActionsGroupBox(TestMainWindow):
 
     def test_autoSelectBtn_clicked_connected_to_imageViewW_autoSelect(self):
         self.mw.autoSelectBtn = mock.Mock(spec=pushbutton.PushButton)
-        self.mw._setActionsGroupBox()
+        mainwindow.MainWindow._setActionsGroupBox(self.mw)
 
         self.mw.autoSelectBtn.clicked.connect.assert_called_once_with(
             self.mw.imageViewWidget.autoSelect
@@ -525,7 +528,7 @@ class TestMainWindowMethodSetActionsGroupBox(TestMainWindow):
 
     def test_unselectBtn_clicked_connected_to_imageViewWidget_unselect(self):
         self.mw.unselectBtn = mock.Mock(spec=QtWidgets.QPushButton)
-        self.mw._setActionsGroupBox()
+        mainwindow.MainWindow._setActionsGroupBox(self.mw)
 
         self.mw.unselectBtn.clicked.connect.assert_called_once_with(
             self.mw.imageViewWidget.unselect
@@ -553,8 +556,8 @@ class TestMainWindowMethodSetMenubar(TestMainWindow):
     def test_preferencesAction_setData_called_with_QVarian_res(self):
         self.mw.preferencesAction = mock.Mock(spec=QtWidgets.QAction)
         mock_var = mock.Mock(spec=QtCore.QVariant)
-        with mock.patch('PyQt5.QtCore.QVariant',
-                        return_value=mock_var) as mock_qvar_call:
+        with mock.patch.object(QtCore, 'QVariant',
+                               return_value=mock_var) as mock_qvar_call:
             self.mw._setMenubar()
 
         calls = [mock.call(self.mw.preferencesWindow)]
@@ -629,8 +632,8 @@ class TestMainWindowMethodSetMenubar(TestMainWindow):
     def test_aboutAction_setData_called_with_QVarian_res(self):
         self.mw.aboutAction = mock.Mock(spec=QtWidgets.QAction)
         mock_var = mock.Mock(spec=QtCore.QVariant)
-        with mock.patch('PyQt5.QtCore.QVariant',
-                        return_value=mock_var) as mock_qvar_call:
+        with mock.patch.object(QtCore, 'QVariant',
+                               return_value=mock_var) as mock_qvar_call:
             self.mw._setMenubar()
 
         calls = [mock.call(self.mw.aboutWindow)]
@@ -647,14 +650,16 @@ class TestMainWindowMethodSetMenubar(TestMainWindow):
         )
 
 
-class TestMainWindowMethodStartProcessing(TestMainWindow):
-
-    PATCH_PROC = 'myfyrio.workers.ImageProcessing'
-    PATCH_WORKERS = 'myfyrio.workers.Worker'
-    PATCH_ERRN = 'myfyrio.gui.errornotifier.'
+class TestMainWindowMethodStartProcessing(TestMainWindowStub):
 
     def setUp(self):
+        super().setUp()
+
         self.mock_proc = mock.Mock(spec=workers.ImageProcessing)
+        patcher = mock.patch.object(workers, 'ImageProcessing',
+                                    return_value=self.mock_proc)
+        self.mock_proc_call = patcher.start()
+        self.addCleanup(patcher.stop)
 
         self.mock_stopBtn = mock.Mock(spec=pushbutton.PushButton)
         self.mw.stopBtn = self.mock_stopBtn
@@ -663,66 +668,57 @@ class TestMainWindowMethodStartProcessing(TestMainWindow):
         self.mw.threadpool = self.mock_threadpool
 
     def test_args_ImageProcessing_called_with(self):
-        with mock.patch(self.PATCH_PROC,
-                        return_value=self.mock_proc) as mock_proc_call:
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
-        mock_proc_call.assert_called_once_with(
+        self.mock_proc_call.assert_called_once_with(
             self.mw.pathsList.paths(),
             self.mw.preferencesWindow.conf
         )
 
     def test_images_loaded_connected_to_loadedPicLbl_updateNumber(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.images_loaded.connect.assert_called_once_with(
             self.mw.loadedPicLbl.updateNumber
         )
 
     def test_found_in_cache_connected_to_foundInCacheLbl_updateNumber(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.found_in_cache.connect.assert_called_once_with(
             self.mw.foundInCacheLbl.updateNumber
         )
 
     def test_hashes_calculated_connected_to_calculatedLbl_updateNumber(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.hashes_calculated.connect.assert_called_once_with(
             self.mw.calculatedLbl.updateNumber
         )
 
     def test_duplicates_found_connected_to_duplicatesLbl_updateNumber(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.duplicates_found.connect.assert_called_once_with(
             self.mw.duplicatesLbl.updateNumber
         )
 
     def test_groups_found_connected_to_groupsLbl_updateNumber(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.groups_found.connect.assert_called_once_with(
             self.mw.groupsLbl.updateNumber
         )
 
     def test_update_progressbar_connected_to_processProg_setValue(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.update_progressbar.connect.assert_called_once_with(
             self.mw.processProg.setValue
         )
 
     def test_image_group_connected_to_imageViewWidget_render(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.image_group.connect.assert_called_once_with(
             self.mw.imageViewWidget.addGroup,
@@ -730,43 +726,38 @@ class TestMainWindowMethodStartProcessing(TestMainWindow):
         )
 
     def test_error_connected_to_attr_errors_append_method(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_proc.error.connect.assert_called_once_with(
             self.mw._errors.append
         )
 
     def test_interrupted_signal_connected_to_3_slots(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.assertEqual(
             len(self.mock_proc.interrupted.connect.call_args_list), 3
         )
 
     def test_interrupted_connected_to_startBtn_finished(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         calls = [mock.call(self.mw.startBtn.finished)]
         self.mock_proc.interrupted.connect.assert_has_calls(calls)
 
     def test_interrupted_connected_to_stopBtn_disable(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         calls = [mock.call(self.mw.stopBtn.disable)]
         self.mock_proc.interrupted.connect.assert_has_calls(calls)
 
     def test_interrupted_signal_connected_to_errorMessage(self):
         self.mw._errors = ['error']
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         call_args_list = self.mock_proc.interrupted.connect.call_args_list
         f = call_args_list[2][0][0]
-        with mock.patch(self.PATCH_ERRN+'errorMessage') as mock_err_call:
+        with mock.patch.object(errornotifier, 'errorMessage') as mock_err_call:
             f()
 
         mock_err_call.assert_called_once_with(['error'])
@@ -774,16 +765,14 @@ class TestMainWindowMethodStartProcessing(TestMainWindow):
     def test_imageViewWidget_interrupted__to_ImageProcessing_interrupt(self):
         mock_IVW = mock.Mock(spec=imageviewwidget.ImageViewWidget)
         self.mw.imageViewWidget = mock_IVW
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mw.imageViewWidget.interrupted.connect.assert_called_once_with(
             self.mock_proc.interrupt
         )
 
     def test_stopBtn_clicked_connected_to_ImageProcessing_interrupt(self):
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            self.mw._startProcessing()
+        mainwindow.MainWindow._startProcessing(self.mw)
 
         self.mock_stopBtn.clicked.connect.assert_called_once_with(
             self.mock_proc.interrupt
@@ -791,10 +780,9 @@ class TestMainWindowMethodStartProcessing(TestMainWindow):
 
     def test_worker_obj_called_with_ImageProcessing_run_pushed_to_pool(self):
         mock_worker = mock.Mock(spec=workers.Worker)
-        with mock.patch(self.PATCH_PROC, return_value=self.mock_proc):
-            with mock.patch(self.PATCH_WORKERS,
-                            return_value=mock_worker) as mock_worker_call:
-                self.mw._startProcessing()
+        with mock.patch.object(workers, 'Worker',
+                               return_value=mock_worker) as mock_worker_call:
+            mainwindow.MainWindow._startProcessing(self.mw)
 
         mock_worker_call.assert_called_once_with(self.mock_proc.run)
         self.mock_threadpool.start.assert_called_once_with(mock_worker)
@@ -809,7 +797,19 @@ class TestMainWindowMethodCloseEvent(TestMainWindow):
         self.mock_threadpool.activeThreadCount.return_value = 0
         self.mw.threadpool = self.mock_threadpool
 
-        self.spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
+        patcher = mock.patch.object(QtWidgets.QMessageBox, 'question')
+        self.mock_question = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Patched for every test, so the closing loop never really spins
+        # the event loop
+        patcher = mock.patch.object(QtCore.QCoreApplication, 'processEvents')
+        self.mock_processEvents = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # A plain slot is enough to count the "stopBtn.clicked" emissions
+        self.mock_stop_slot = helpers.connectMockSlot(self,
+                                                      self.mw.stopBtn.clicked)
 
     def test_event_ignore_not_called_if_no_confirmation(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
@@ -821,54 +821,48 @@ class TestMainWindowMethodCloseEvent(TestMainWindow):
     def test_stopBtn_clicked_not_emitted_if_no_confirmation_and_disabled(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mw.stopBtn.setEnabled(False)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
 
         self.mw.closeEvent(self.mock_event)
 
-        self.assertEqual(len(spy), 0)
+        self.mock_stop_slot.assert_not_called()
 
     def test_stopBtn_clicked_emitted_if_no_confirmation_and_enabled(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mw.stopBtn.setEnabled(True)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
 
         self.mw.closeEvent(self.mock_event)
 
-        self.assertEqual(len(spy), 1)
+        self.mock_stop_slot.assert_called_once()
 
     def test_processEvents_called_if_no_confirmation_and_active_threads(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mock_threadpool.activeThreadCount.side_effect = [1, 0]
-        PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-        with mock.patch(PATCH_EVENTS) as mock_proc_call:
-            self.mw.closeEvent(self.mock_event)
 
-        mock_proc_call.assert_called_once_with()
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_processEvents.assert_called_once_with()
 
     def test_waitForDone_called_if_no_confirmation_and_active_threads(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mock_threadpool.activeThreadCount.side_effect = [1, 0]
-        PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-        with mock.patch(PATCH_EVENTS):
-            self.mw.closeEvent(self.mock_event)
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.waitForDone.assert_called_once_with(msecs=100)
 
     def test_processEvents_not_called_if_no_confir_and_no_active_threads(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mock_threadpool.activeThreadCount.return_value = 0
-        PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-        with mock.patch(PATCH_EVENTS) as mock_proc_call:
-            self.mw.closeEvent(self.mock_event)
 
-        mock_proc_call.assert_not_called()
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_processEvents.assert_not_called()
 
     def test_waitForDone_not_called_if_no_confir_and_no_active_threads(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = False
         self.mock_threadpool.activeThreadCount.return_value = 0
-        PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-        with mock.patch(PATCH_EVENTS):
-            self.mw.closeEvent(self.mock_event)
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.waitForDone.assert_not_called()
 
@@ -881,136 +875,120 @@ class TestMainWindowMethodCloseEvent(TestMainWindow):
 
     def test_event_ignore_called_if_confirmation_and_Cancel(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_event.ignore.assert_called_once_with()
 
     def test_stopBtn_clicked_not_emitted_if_confirmation__Cancel__disabl(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mw.stopBtn.setEnabled(False)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
 
-        self.assertEqual(len(spy), 0)
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_stop_slot.assert_not_called()
 
     def test_stopBtn_clicked_not_emitted_if_confirmation__Cancel__enabl(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mw.stopBtn.setEnabled(True)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
+
+        self.mw.closeEvent(self.mock_event)
 
-        self.assertEqual(len(spy), 0)
+        self.mock_stop_slot.assert_not_called()
 
     def test_processEvents_not_called_if_confirmation_and_Cancel(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS) as mock_proc_call:
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
 
-        mock_proc_call.assert_not_called()
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_processEvents.assert_not_called()
 
     def test_waitForDone_not_called_if_confirmation_and_Cancel(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS):
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.waitForDone.assert_not_called()
 
     def test_threadpool_clear_not_called_if_confirmation_and_Cancel(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Cancel):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Cancel
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.clear.assert_not_called()
 
     def test_event_ignore_not_called_if_confirmation_and_Yes(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_event.ignore.assert_not_called()
 
     def test_stopBtn_clicked_not_emitted_if_confirmation__Yes__disabled(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mw.stopBtn.setEnabled(False)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
-        self.assertEqual(len(spy), 0)
+        self.mock_stop_slot.assert_not_called()
 
     def test_stopBtn_clicked_emitted_if_confirmation__Yes__enabled(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mw.stopBtn.setEnabled(True)
-        spy = QtTest.QSignalSpy(self.mw.stopBtn.clicked)
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
 
-        self.assertEqual(len(spy), 1)
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_stop_slot.assert_called_once()
 
     def test_processEvents_called_if_confirmation__Yes_and_active_thread(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mock_threadpool.activeThreadCount.side_effect = [1, 0]
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS) as mock_proc_call:
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
-        mock_proc_call.assert_called_once_with()
+        self.mock_processEvents.assert_called_once_with()
 
     def test_waitForDone_called_if_confirmation__Yes_and_active_thread(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mock_threadpool.activeThreadCount.side_effect = [1, 0]
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS):
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.waitForDone.assert_called_once_with(msecs=100)
 
     def test_processEvents_not_called_if_confir__Yes__no_active_thread(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mock_threadpool.activeThreadCount.return_value = 0
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS) as mock_proc_call:
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
 
-        mock_proc_call.assert_not_called()
+        self.mw.closeEvent(self.mock_event)
+
+        self.mock_processEvents.assert_not_called()
 
     def test_waitForDone_not_called_if_confir__Yes__no_active_thread(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
         self.mock_threadpool.activeThreadCount.return_value = 0
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            PATCH_EVENTS = 'PyQt5.QtCore.QCoreApplication.processEvents'
-            with mock.patch(PATCH_EVENTS):
-                self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.waitForDone.assert_not_called()
 
     def test_threadpool_clear_called_if_confirmation_and_Yes(self):
         self.mw.preferencesWindow.conf['close_confirmation'] = True
-        with mock.patch('PyQt5.QtWidgets.QMessageBox.question',
-                        return_value=QtWidgets.QMessageBox.Yes):
-            self.mw.closeEvent(self.mock_event)
+        self.mock_question.return_value = QtWidgets.QMessageBox.Yes
+
+        self.mw.closeEvent(self.mock_event)
 
         self.mock_threadpool.clear.assert_called_once_with()
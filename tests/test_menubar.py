@@ -21,11 +21,10 @@ from unittest import TestCase, mock
 from PyQt5 import QtWidgets
 
 from myfyrio.gui import menubar
+from tests import _qapp
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 MBAR = 'myfyrio.gui.menubar.MenuBar.'
 
@@ -34,8 +33,10 @@ MBAR = 'myfyrio.gui.menubar.MenuBar.'
 
 class TestClassMenuBar(TestCase):
 
-    def setUp(self):
-        self.w = menubar.MenuBar()
+    # No test changes the menu bar itself, so one instance per class is enough
+    @classmethod
+    def setUpClass(cls):
+        cls.w = menubar.MenuBar()
 
 
 class TestClassMenuBarMethodInit(TestClassMenuBar):
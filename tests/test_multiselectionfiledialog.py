@@ -21,11 +21,10 @@ from unittest import TestCase, mock
 from PyQt5 import QtCore, QtWidgets, QtGui
 
 from myfyrio.gui import multiselectionfiledialog
+from tests import _qapp
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 MS = 'myfyrio.gui.multiselectionfiledialog.'
 
@@ -52,7 +51,7 @@ class TestMousePressFilterMethodEventFilter(TestMousePressFilter):
     def setUp(self):
         super().setUp()
 
-        self.obj = mock.Mock()
+        self.obj = mock.NonCallableMock()
         self.event = mock.Mock(spec=QtGui.QMouseEvent)
 
     def test_return_False_if_not_MouseButtonPress_event(self):
@@ -111,7 +110,7 @@ class TestCtrlPressFilterMethodEventFilter(TestCtrlPressFilter):
     def setUp(self):
         super().setUp()
 
-        self.obj = mock.Mock()
+        self.obj = mock.NonCallableMock()
         self.event = mock.Mock(spec=QtGui.QKeyEvent)
 
     def test_return_False_if_not_KeyPress_event(self):
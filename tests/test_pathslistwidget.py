@@ -18,14 +18,13 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtCore, QtTest, QtWidgets
+from PyQt5 import QtCore
 
 from myfyrio.gui import multiselectionfiledialog, pathslistwidget
+from tests import _qapp, helpers
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 PLW_MODULE = 'myfyrio.gui.pathslistwidget.'
 
@@ -85,37 +84,33 @@ class TestPathsListWidgetMethodHasSelectedItems(TestPathsListWidget):
 
     def test_emit_hasSelection_signal_with_True_if_any_item_selected(self):
         self.w.item(0).setSelected(True)
-        spy = QtTest.QSignalSpy(self.w.hasSelection)
+        mock_slot = helpers.connectMockSlot(self, self.w.hasSelection)
         self.w._hasSelectedItems()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTrue(spy[0][0])
+        mock_slot.assert_called_once_with(True)
 
     def test_emit_hasSelection_signal_with_False_if_no_item_selected(self):
-        spy = QtTest.QSignalSpy(self.w.hasSelection)
+        mock_slot = helpers.connectMockSlot(self, self.w.hasSelection)
         self.w._hasSelectedItems()
 
-        self.assertEqual(len(spy), 1)
-        self.assertFalse(spy[0][0])
+        mock_slot.assert_called_once_with(False)
 
 
 class TestPathsListWidgetMethodHasItems(TestPathsListWidget):
 
     def test_emit_hasItems_signal_with_True_if_there_are_items(self):
-        spy = QtTest.QSignalSpy(self.w.hasItems)
+        mock_slot = helpers.connectMockSlot(self, self.w.hasItems)
         self.w._hasItems()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTrue(spy[0][0])
+        mock_slot.assert_called_once_with(True)
 
     def test_emit_hasItems_signal_with_False_if_there_is_no_items(self):
         for _ in range(self.w.count()):
             self.w.takeItem(0)
-        spy = QtTest.QSignalSpy(self.w.hasItems)
+        mock_slot = helpers.connectMockSlot(self, self.w.hasItems)
         self.w._hasItems()
 
-        self.assertEqual(len(spy), 1)
-        self.assertFalse(spy[0][0])
+        mock_slot.assert_called_once_with(False)
 
 
 class TestPathsListWidgetMethodPaths(TestPathsListWidget):
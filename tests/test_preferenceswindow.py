@@ -16,37 +16,56 @@ You should have received a copy of the GNU General Public License
 along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-import logging
 from unittest import TestCase, mock
 
+import pytest
 from PyQt5 import QtCore, QtWidgets
 
 from myfyrio import config
 from myfyrio.gui import preferenceswindow
+from tests import _qapp
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
-
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 PW_MODULE = 'myfyrio.gui.preferenceswindow.'
 
+# The windows are built from the .ui files
+pytestmark = pytest.mark.slow
+
 # pylint: disable=missing-class-docstring
 
 
+def setUpModule():
+    # Loading the .ui file is expensive, so the window is built once for
+    # the whole module and stored on the base class. Every test gets back
+    # the original widget list and a fresh copy of the config data. The
+    # window starts with the default config instead of reading the one on
+    # the disk
+    base = TestPreferencesWindow
+
+    default_conf = config.Config()
+    default_conf._default()
+    with mock.patch(base.PW+'_load_config', return_value=default_conf):
+        base.w = preferenceswindow.PreferencesWindow()
+    base.widgets = list(base.w._widgets)
+    base.conf = base.w.conf
+    base.conf_data = dict(base.conf.data)
+
+
+def tearDownModule():
+    TestPreferencesWindow.w.close()
+    TestPreferencesWindow.w.deleteLater()
+
+
 class TestPreferencesWindow(TestCase):
 
     PW = PW_MODULE + 'PreferencesWindow.'
 
     def setUp(self):
-        self.w = preferenceswindow.PreferencesWindow()
+        self.w._widgets = list(self.widgets)
+        self.conf.data = dict(self.conf_data)
+        self.w.conf = self.conf
         self.clear_widgets()
 
     def clear_widgets(self):
@@ -62,13 +81,14 @@ class TestPreferencesWindow(TestCase):
 
 class TestMethodGatherWidgets(TestPreferencesWindow):
 
+    WIDGET_CLASSES = (QtWidgets.QComboBox, QtWidgets.QCheckBox,
+                      QtWidgets.QSpinBox, QtWidgets.QGroupBox)
+
     def test_all_widgets_of_proper_classes(self):
-        classes = (QtWidgets.QComboBox, QtWidgets.QCheckBox,
-                   QtWidgets.QSpinBox, QtWidgets.QGroupBox)
         widgets = self.w._gather_widgets()
 
         for w in widgets:
-            self.assertIsInstance(w, classes)
+            self.assertIsInstance(w, self.WIDGET_CLASSES)
 
     def test_all_widgets_have_property_conf_param(self):
         widgets = self.w._gather_widgets()
@@ -287,32 +307,33 @@ class TestMethodSetMaxCores(TestPreferencesWindow):
 
 class TestMethodSavePreferences(TestPreferencesWindow):
 
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.multiple(
+            PW_MODULE+'PreferencesWindow', _gather_prefs=mock.DEFAULT,
+            _save_config=mock.DEFAULT, _setMaxCores=mock.DEFAULT,
+            close=mock.DEFAULT
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_gather_prefs_called(self):
-        with mock.patch(self.PW+'_gather_prefs') as mock_gather:
-            with mock.patch(self.PW+'_save_config'):
-                self.w._savePreferences()
+        self.w._savePreferences()
 
-        mock_gather.assert_called_once_with()
+        self.mocks['_gather_prefs'].assert_called_once_with()
 
     def test_save_config_called(self):
-        with mock.patch(self.PW+'_gather_prefs'):
-            with mock.patch(self.PW+'_save_config') as mock_save_call:
-                self.w._savePreferences()
+        self.w._savePreferences()
 
-        mock_save_call.assert_called_once_with()
+        self.mocks['_save_config'].assert_called_once_with()
 
     def test_setMaxCores_called(self):
-        with mock.patch(self.PW+'_gather_prefs'):
-            with mock.patch(self.PW+'_save_config'):
-                with mock.patch(self.PW+'_setMaxCores') as mock_cores_call:
-                    self.w._savePreferences()
+        self.w._savePreferences()
 
-        mock_cores_call.assert_called_once_with()
+        self.mocks['_setMaxCores'].assert_called_once_with()
 
-    @mock.patch('PyQt5.QtWidgets.QMainWindow.close')
-    def test_close_called(self, mock_close_call):
-        with mock.patch(self.PW+'_gather_prefs'):
-            with mock.patch(self.PW+'_save_config'):
-                self.w._savePreferences()
+    def test_close_called(self):
+        self.w._savePreferences()
 
-        mock_close_call.assert_called_once()
+        self.mocks['close'].assert_called_once()
@@ -18,14 +18,11 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtWidgets
-
 from myfyrio.gui import pushbutton
+from tests import _qapp
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 PB_MODULE = 'myfyrio.gui.pushbutton.'
 
@@ -18,14 +18,13 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest import TestCase, mock
 
-from PyQt5 import QtTest, QtWidgets
+from PyQt5 import QtWidgets
 
 from myfyrio.gui import sensitivityradiobutton
+from tests import _qapp, helpers
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 SRBtn_MODULE = 'myfyrio.gui.sensitivityradiobutton.'
 
@@ -105,93 +104,29 @@ class TestClassSensitivityRBtnMethodSetSignals(TestClassSensitivityRBtn):
 class TestClassSensitivityRBtnMethodEmitSensitivity(TestClassSensitivityRBtn):
 
     def test_sensitivityChanged_signal_emitted_with_sensitivity_arg(self):
-        spy = QtTest.QSignalSpy(self.w.sensitivityChanged)
+        mock_slot = helpers.connectMockSlot(self, self.w.sensitivityChanged)
         self.w._emitSensitivity()
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], self.w.sensitivity)
+        mock_slot.assert_called_once_with(self.w.sensitivity)
 
 
-class TestClassVeryHighRBtn(TestCase):
+class TestClassSensitivityRBtnSubclassesMethodInit(TestCase):
 
-    def setUp(self):
-        self.w = sensitivityradiobutton.VeryHighRadioButton()
-
-
-class TestClassVeryHighRBtnMethodInit(TestClassVeryHighRBtn):
-
-    def test_attr_sensitivity_is_0(self):
-        self.assertEqual(self.w.sensitivity, 0)
-
-    def test_VeryHighRadioButton_is_subclass_of_SensitivityRadioButton(self):
-        self.assertIsInstance(
-            self.w, sensitivityradiobutton.SensitivityRadioButton
-        )
-
-
-class TestClassHighRBtn(TestCase):
-
-    def setUp(self):
-        self.w = sensitivityradiobutton.HighRadioButton()
-
-
-class TestClassHighRBtnMethodInit(TestClassHighRBtn):
-
-    def test_attr_sensitivity_is_5(self):
-        self.assertEqual(self.w.sensitivity, 5)
-
-    def test_HighRadioButton_is_subclass_of_SensitivityRadioButton(self):
-        self.assertIsInstance(
-            self.w, sensitivityradiobutton.SensitivityRadioButton
-        )
-
-
-class TestClassMediumRBtn(TestCase):
-
-    def setUp(self):
-        self.w = sensitivityradiobutton.MediumRadioButton()
+    # Subclass and the sensitivity it is created with
+    SUBCLASSES = (
+        (sensitivityradiobutton.VeryHighRadioButton, 0),
+        (sensitivityradiobutton.HighRadioButton, 5),
+        (sensitivityradiobutton.MediumRadioButton, 10),
+        (sensitivityradiobutton.LowRadioButton, 15),
+        (sensitivityradiobutton.VeryLowRadioButton, 20),
+    )
 
+    def test_attr_sensitivity_and_SensitivityRadioButton_subclass(self):
+        for cls, sensitivity in self.SUBCLASSES:
+            with self.subTest(cls=cls.__name__):
+                w = cls()
 
-class TestClassMediumRBtnMethodInit(TestClassMediumRBtn):
-
-    def test_attr_sensitivity_is_10(self):
-        self.assertEqual(self.w.sensitivity, 10)
-
-    def test_MediumRadioButton_is_subclass_of_SensitivityRadioButton(self):
-        self.assertIsInstance(
-            self.w, sensitivityradiobutton.SensitivityRadioButton
-        )
-
-
-class TestClassLowRBtn(TestCase):
-
-    def setUp(self):
-        self.w = sensitivityradiobutton.LowRadioButton()
-
-
-class TestClassLowRBtnMethodInit(TestClassLowRBtn):
-
-    def test_attr_sensitivity_is_15(self):
-        self.assertEqual(self.w.sensitivity, 15)
-
-    def test_LowRadioButton_is_subclass_of_SensitivityRadioButton(self):
-        self.assertIsInstance(
-            self.w, sensitivityradiobutton.SensitivityRadioButton
-        )
-
-
-class TestClassVeryLowRBtn(TestCase):
-
-    def setUp(self):
-        self.w = sensitivityradiobutton.VeryLowRadioButton()
-
-
-class TestClassVeryLowRBtnMethodInit(TestClassVeryLowRBtn):
-
-    def test_attr_sensitivity_is_20(self):
-        self.assertEqual(self.w.sensitivity, 20)
-
-    def test_VeryLowRadioButton_is_subclass_of_SensitivityRadioButton(self):
-        self.assertIsInstance(
-            self.w, sensitivityradiobutton.SensitivityRadioButton
-        )
+                self.assertEqual(w.sensitivity, sensitivity)
+                self.assertIsInstance(
+                    w, sensitivityradiobutton.SensitivityRadioButton
+                )
@@ -17,37 +17,33 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
 
-import logging
 from unittest import TestCase, mock
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from myfyrio import core, workers
+from myfyrio import core, resources, workers
 from myfyrio.gui import thumbnailwidget
+from tests import _qapp, helpers
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+THW_CLS = thumbnailwidget.ThumbnailWidget
 
-VIEW = 'myfyrio.gui.thumbnailwidget.'
+IMAGE_SPEC = helpers.specOf(core.Image)
+QPIXMAP_SPEC = helpers.specOf(QtGui.QPixmap)
+QTIMER_SPEC = helpers.specOf(QtCore.QTimer)
+QTHREADPOOL_SPEC = helpers.specOf(QtCore.QThreadPool)
+PROCESSING_SPEC = helpers.specOf(workers.ThumbnailProcessing)
+WORKER_SPEC = helpers.specOf(workers.Worker)
 
 # pylint: disable=unused-argument,missing-class-docstring
 
 
 class TestThumbnailWidget(TestCase):
 
-    ThW = VIEW + 'ThumbnailWidget.'
-
     def setUp(self):
-        self.mock_image = mock.Mock(spec=core.Image)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
         self.mock_image.thumb = None
         self.mock_image.path = 'path'
         self.mock_image.scaling_dimensions.return_value = (1, 1)
@@ -55,12 +51,33 @@ class TestThumbnailWidget(TestCase):
         self.size = 333
         self.lazy = True
 
-        with mock.patch(self.ThW+'_setEmptyPixmap'):
-            with mock.patch(self.ThW+'_setSize'):
+        with mock.patch.object(THW_CLS, '_setEmptyPixmap'):
+            with mock.patch.object(THW_CLS, '_setSize'):
                 self.w = thumbnailwidget.ThumbnailWidget(self.mock_image,
                                                          self.size, self.lazy)
 
 
+class TestThumbnailWidgetShared(TestCase):
+
+    # For the classes that only call methods of a ready widget: one widget
+    # per class, and 'setUp' gives it a new image and 'empty' state. Each
+    # class sets the rest of the attributes its tests use itself
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.multiple(THW_CLS, _setEmptyPixmap=mock.DEFAULT,
+                                 _setSize=mock.DEFAULT):
+            cls.w = thumbnailwidget.ThumbnailWidget(
+                mock.Mock(spec=IMAGE_SPEC), 333, True
+            )
+
+    def setUp(self):
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
+        self.mock_image.thumb = None
+
+        self.w._image = self.mock_image
+        self.w.empty = True
+
+
 class TestThumbnailWidgetMethodInit(TestThumbnailWidget):
 
     def test_init_values(self):
@@ -75,9 +92,9 @@ class TestThumbnailWidgetMethodInit(TestThumbnailWidget):
         self.assertEqual(self.w.frameStyle(), QtWidgets.QFrame.Box)
 
     def test_setEmptyPixmap_called_and_set_to_attr_pixmap(self):
-        mock_pixmap = mock.Mock(spec=QtGui.QPixmap)
-        with mock.patch(self.ThW+'_setEmptyPixmap',
-                        return_value=mock_pixmap) as mock_empty_call:
+        mock_pixmap = mock.Mock(spec=QPIXMAP_SPEC)
+        with mock.patch.object(THW_CLS, '_setEmptyPixmap',
+                               return_value=mock_pixmap) as mock_empty_call:
             w = thumbnailwidget.ThumbnailWidget(self.mock_image,
                                                 self.size, self.lazy)
 
@@ -85,7 +102,7 @@ class TestThumbnailWidgetMethodInit(TestThumbnailWidget):
         self.assertEqual(w._pixmap, mock_pixmap)
 
     def test_setSize_called(self):
-        with mock.patch(self.ThW+'_setSize') as mock_size_call:
+        with mock.patch.object(THW_CLS, '_setSize') as mock_size_call:
             thumbnailwidget.ThumbnailWidget(self.mock_image, self.size, True)
 
         mock_size_call.assert_called_once_with()
@@ -96,8 +113,8 @@ class TestThumbnailWidgetMethodInit(TestThumbnailWidget):
         self.assertIsInstance(w._qtimer, QtCore.QTimer)
 
     def test_makeThumbnail_called_if_not_lazy(self):
-        with mock.patch(self.ThW+'_makeThumbnail') as mock_make_call:
-            with mock.patch(self.ThW+'_setThumbnail'):
+        with mock.patch.object(THW_CLS, '_makeThumbnail') as mock_make_call:
+            with mock.patch.object(THW_CLS, '_setThumbnail'):
                 thumbnailwidget.ThumbnailWidget(
                     self.mock_image, self.size, False
                 )
@@ -105,8 +122,8 @@ class TestThumbnailWidgetMethodInit(TestThumbnailWidget):
         mock_make_call.assert_called_once_with()
 
     def test_setThumbnail_called_if_not_lazy(self):
-        with mock.patch(self.ThW+'_makeThumbnail'):
-            with mock.patch(self.ThW+'_setThumbnail') as mock_set_call:
+        with mock.patch.object(THW_CLS, '_makeThumbnail'):
+            with mock.patch.object(THW_CLS, '_setThumbnail') as mock_set_call:
                 thumbnailwidget.ThumbnailWidget(
                     self.mock_image, self.size, False
                 )
@@ -147,34 +164,37 @@ class TestThumbnailWidgetMethodSetSize(TestThumbnailWidget):
 
 class TestThumbnailWidgetMethodSetEmptyPixmap(TestThumbnailWidget):
 
+    def setUp(self):
+        super().setUp()
+
+        self.mock_pixmap = mock.Mock(spec=QPIXMAP_SPEC)
+        patcher = mock.patch.object(QtGui, 'QPixmap',
+                                    return_value=self.mock_pixmap)
+        self.mock_QPixmap_call = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(THW_CLS, 'setPixmap')
+        self.mock_setPixmap = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_null_QPixmap_made(self):
-        with mock.patch('PyQt5.QtGui.QPixmap') as mock_QPixmap_call:
-            with mock.patch(self.ThW+'setPixmap'):
-                self.w._setEmptyPixmap()
+        self.w._setEmptyPixmap()
 
-        mock_QPixmap_call.assert_called_once_with()
+        self.mock_QPixmap_call.assert_called_once_with()
 
     def test_pixmap_returned(self):
-        mock_pixmap = mock.Mock(spec=QtGui.QPixmap)
-        with mock.patch('PyQt5.QtGui.QPixmap', return_value=mock_pixmap):
-            with mock.patch(self.ThW+'setPixmap'):
-                res = self.w._setEmptyPixmap()
+        res = self.w._setEmptyPixmap()
 
-        self.assertEqual(res, mock_pixmap)
+        self.assertEqual(res, self.mock_pixmap)
 
     def test_setPixmap_called_with_QPixmap_result(self):
-        mock_pixmap = mock.Mock(spec=QtGui.QPixmap)
-        with mock.patch('PyQt5.QtGui.QPixmap', return_value=mock_pixmap):
-            with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-                self.w._setEmptyPixmap()
+        self.w._setEmptyPixmap()
 
-        mock_setPixmap_call.assert_called_once_with(mock_pixmap)
+        self.mock_setPixmap.assert_called_once_with(self.mock_pixmap)
 
     def test_attr_empty_set_to_True(self):
         self.w.empty = False
-        with mock.patch('PyQt5.QtGui.QPixmap'):
-            with mock.patch(self.ThW+'setPixmap'):
-                self.w._setEmptyPixmap()
+        self.w._setEmptyPixmap()
 
         self.assertTrue(self.w.empty)
 
@@ -184,154 +204,134 @@ class TestThumbnailWidgetMethodSetThumbnail(TestThumbnailWidget):
     def setUp(self):
         super().setUp()
 
-        self.mock_pixmap = mock.Mock(spec=QtGui.QPixmap)
+        self.mock_pixmap = mock.Mock(spec=QPIXMAP_SPEC)
         self.w._pixmap = self.mock_pixmap
 
+        patcher = mock.patch.multiple(
+            THW_CLS,
+            setPixmap=mock.DEFAULT,
+            _errorThumbnail=mock.Mock(return_value='error_image'),
+        )
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_setPixmap = mocks['setPixmap']
+
+    def _checkSetPixmapCalls(self):
+        # Result of 'convertFromImage' and the pixmap 'setPixmap' gets then
+        conversions = ((True, self.mock_pixmap), (False, 'error_image'))
+        for converted, pixmap in conversions:
+            with self.subTest(converted=converted):
+                self.w._pixmap = self.mock_pixmap
+                self.mock_setPixmap.reset_mock()
+                self.mock_pixmap.convertFromImage.return_value = converted
+                self.w._setThumbnail()
+
+                self.mock_setPixmap.assert_called_once_with(pixmap)
+
     def test_convertFromImage_called_with_image_thumb_arg_if_not_lazy(self):
         self.w._lazy = False
         self.mock_pixmap.convertFromImage.return_value = True
-        with mock.patch(self.ThW+'setPixmap'):
-            self.w._setThumbnail()
+        self.w._setThumbnail()
 
         self.mock_pixmap.convertFromImage.assert_called_once_with(
             self.w._image.thumb
         )
 
-    def test_setPixmap_called_with_image_from_attr_thumb_if_not_lazy(self):
+    def test_setPixmap_called_with_thumb_or_error_image_if_not_lazy(self):
         self.w._lazy = False
-        self.mock_pixmap.convertFromImage.return_value = True
-        with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-            self.w._setThumbnail()
-
-        mock_setPixmap_call.assert_called_once_with(self.mock_pixmap)
+        self._checkSetPixmapCalls()
 
     def test_errorThumbnail_called_if_image_thumb_cant_be_read__not_lazy(self):
         self.w._lazy = False
         self.mock_pixmap.convertFromImage.return_value = False
-        with mock.patch(self.ThW+'setPixmap'):
-            with mock.patch(self.ThW+'_errorThumbnail') as mock_err_call:
-                self.w._setThumbnail()
-
-        mock_err_call.assert_called_once_with()
-
-    def test_setPixmap_called__error_img_if_thumb_cant_be_read__not_lazy(self):
-        self.w._lazy = False
-        self.mock_pixmap.convertFromImage.return_value = False
-        with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-            with mock.patch(self.ThW+'_errorThumbnail',
-                            return_value='error_image'):
-                self.w._setThumbnail()
+        self.w._setThumbnail()
 
-        mock_setPixmap_call.assert_called_once_with('error_image')
+        self.w._errorThumbnail.assert_called_once_with()
 
     def test_empty_attr_set_to_False_if_not_lazy(self):
         self.w._lazy = False
         self.mock_pixmap.convertFromImage.return_value = True
         self.w.empty = True
-        with mock.patch(self.ThW+'setPixmap'):
-            self.w._setThumbnail()
+        self.w._setThumbnail()
 
         self.assertFalse(self.w.empty)
 
     def test_qtimer_start_not_called_if_not_lazy(self):
         self.w._lazy = False
         self.mock_pixmap.convertFromImage.return_value = True
-        qtimer = mock.Mock(spec=QtCore.QTimer)
+        qtimer = mock.Mock(spec=QTIMER_SPEC)
         self.w._qtimer = qtimer
-        with mock.patch(self.ThW+'setPixmap'):
-            self.w._setThumbnail()
+        self.w._setThumbnail()
 
         qtimer.start.assert_not_called()
 
     def test_convertFromImage_called_with_img_thumb_if_lazy_and_visible(self):
         self.w._lazy = True
         self.mock_pixmap.convertFromImage.return_value = True
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap'):
-                self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=True):
+            self.w._setThumbnail()
 
         self.mock_pixmap.convertFromImage.assert_called_once_with(
             self.w._image.thumb
         )
 
-    def test_setPixmap_called_with_img_read_from_thumb_if_lazy_and_vis(self):
+    def test_setPixmap_called_with_thumb_or_error_image_if_lazy_and_vis(self):
         self.w._lazy = True
-        self.mock_pixmap.convertFromImage.return_value = True
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-                self.w._setThumbnail()
-
-        mock_setPixmap_call.assert_called_once_with(self.mock_pixmap)
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=True):
+            self._checkSetPixmapCalls()
 
     def test_errorThumbnail_called_if_img_cant_be_read_if_lazy_and_vis(self):
         self.w._lazy = True
         self.mock_pixmap.convertFromImage.return_value = False
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap'):
-                with mock.patch(self.ThW+'_errorThumbnail') as mock_err_call:
-                    self.w._setThumbnail()
-
-        mock_err_call.assert_called_once_with()
-
-    def test_setPixmap_called__err_img_if_thumb_cant_be_read__lazy__vis(self):
-        self.w._lazy = True
-        self.mock_pixmap.convertFromImage.return_value = False
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-                with mock.patch(self.ThW+'_errorThumbnail',
-                                return_value='error_image'):
-                    self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=True):
+            self.w._setThumbnail()
 
-        mock_setPixmap_call.assert_called_once_with('error_image')
+        self.w._errorThumbnail.assert_called_once_with()
 
     def test_empty_attr_set_to_False_if_lazy_and_visible(self):
         self.w._lazy = True
         self.mock_pixmap.convertFromImage.return_value = True
         self.w.empty = True
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap'):
-                self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=True):
+            self.w._setThumbnail()
 
         self.assertFalse(self.w.empty)
 
     def test_qtimer_start_called_if_lazy_and_visible(self):
         self.w._lazy = True
         self.mock_pixmap.convertFromImage.return_value = True
-        qtimer = mock.Mock(spec=QtCore.QTimer)
+        qtimer = mock.Mock(spec=QTIMER_SPEC)
         self.w._qtimer = qtimer
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'setPixmap'):
-                self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=True):
+            self.w._setThumbnail()
 
         qtimer.start.assert_called_once_with(10000)
 
     def test_convertFromImage_not_called_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
             self.w._setThumbnail()
 
         self.mock_pixmap.convertFromImage.assert_not_called()
 
     def test_setPixmap_not_called_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'setPixmap') as mock_setPixmap_call:
-                self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
+            self.w._setThumbnail()
 
-        mock_setPixmap_call.assert_not_called()
+        self.mock_setPixmap.assert_not_called()
 
     def test_errorThumbnail_not_called_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'_errorThumbnail') as mock_err_call:
-                self.w._setThumbnail()
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
+            self.w._setThumbnail()
 
-        mock_err_call.assert_not_called()
+        self.w._errorThumbnail.assert_not_called()
 
     def test_updateGeometry_not_called_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'updateGeometry') as mock_upd_call:
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
+            with mock.patch.object(THW_CLS, 'updateGeometry') as mock_upd_call:
                 self.w._setThumbnail()
 
         mock_upd_call.assert_not_called()
@@ -339,23 +339,23 @@ class TestThumbnailWidgetMethodSetThumbnail(TestThumbnailWidget):
     def test_empty_attr_stay_True_if_lazy_and_not_visible(self):
         self.w._lazy = True
         self.w.empty = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
             self.w._setThumbnail()
 
         self.assertTrue(self.w.empty)
 
     def test_qtimer_start_not_called_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        qtimer = mock.Mock(spec=QtCore.QTimer)
+        qtimer = mock.Mock(spec=QTIMER_SPEC)
         self.w._qtimer = qtimer
-        with mock.patch(self.ThW+'isVisible', return_value=False):
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
             self.w._setThumbnail()
 
         qtimer.start.assert_not_called()
 
     def test_assign_None_to_image_attr_thumb_if_lazy_and_not_visible(self):
         self.w._lazy = True
-        with mock.patch(self.ThW+'isVisible', return_value=False):
+        with mock.patch.object(THW_CLS, 'isVisible', return_value=False):
             self.w._setThumbnail()
 
         self.assertIsNone(self.w._image.thumb)
@@ -363,88 +363,132 @@ class TestThumbnailWidgetMethodSetThumbnail(TestThumbnailWidget):
 
 class TestThumbnailWidgetMethodErrorThumbnail(TestThumbnailWidget):
 
+    def setUp(self):
+        super().setUp()
+
+        self.error_records = helpers.captureErrors(
+            self, 'main.thumbnailwidget'
+        )
+
+        self.mock_pixmap = mock.Mock(spec=QPIXMAP_SPEC)
+        self.mock_pixmap.scaled.return_value = 'scaled_img'
+
+        patcher = mock.patch.object(QtGui, 'QPixmap',
+                                    return_value=self.mock_pixmap)
+        self.mock_QPixmap_call = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(resources.Image, 'get',
+                                    return_value='image_path')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Start every test with the error image not cached yet
+        find_patcher = mock.patch.object(QtGui.QPixmapCache, 'find',
+                                         return_value=None)
+        self.mock_find = find_patcher.start()
+        self.addCleanup(find_patcher.stop)
+
+        insert_patcher = mock.patch.object(QtGui.QPixmapCache, 'insert')
+        self.mock_insert = insert_patcher.start()
+        self.addCleanup(insert_patcher.stop)
+
     def test_logging(self):
-        with self.assertLogs('main.thumbnailwidget', 'ERROR'):
-            self.w._errorThumbnail()
+        self.w._errorThumbnail()
+
+        self.assertTrue(self.error_records)
 
     def test_QPixmap_called_with_error_image_path(self):
-        with mock.patch('PyQt5.QtGui.QPixmap') as mock_pixmap_call:
-            with mock.patch('myfyrio.resources.Image.get',
-                            return_value='image_path'):
-                self.w._errorThumbnail()
+        self.w._errorThumbnail()
 
-        mock_pixmap_call.assert_called_once_with('image_path')
+        self.mock_QPixmap_call.assert_called_once_with('image_path')
+
+    def test_error_image_put_in_cache_if_not_cached(self):
+        self.w._errorThumbnail()
+
+        self.mock_find.assert_called_once_with('image_path')
+        self.mock_insert.assert_called_once_with('image_path',
+                                                 self.mock_pixmap)
+
+    def test_cached_error_image_used_if_cached(self):
+        cached_pixmap = mock.Mock(spec=QPIXMAP_SPEC)
+        cached_pixmap.scaled.return_value = 'scaled_cached_img'
+        self.mock_find.return_value = cached_pixmap
+        res = self.w._errorThumbnail()
+
+        self.mock_QPixmap_call.assert_not_called()
+        self.mock_insert.assert_not_called()
+        self.assertEqual(res, 'scaled_cached_img')
 
     def test_return_scaled_image_with_size_from_attr_size(self):
-        mock_pixmap = mock.Mock(spec=QtGui.QPixmap)
-        mock_pixmap.scaled.return_value = 'scaled_img'
-        with mock.patch('PyQt5.QtGui.QPixmap', return_value=mock_pixmap):
-            res = self.w._errorThumbnail()
+        res = self.w._errorThumbnail()
 
-        mock_pixmap.scaled.assert_called_once_with(self.w._size, self.w._size)
+        self.mock_pixmap.scaled.assert_called_once_with(self.w._size,
+                                                        self.w._size)
         self.assertEqual(res, 'scaled_img')
 
 
 class TestThumbnailWidgetMethodMakeThumbnail(TestThumbnailWidget):
 
-    PROC = 'myfyrio.workers.'
+    def setUp(self):
+        super().setUp()
+
+        self.mock_proc = mock.Mock(spec=PROCESSING_SPEC)
+        self.mock_threadpool = mock.Mock(spec=QTHREADPOOL_SPEC)
+        self.mock_worker = mock.Mock(spec=WORKER_SPEC)
+        self.mock_proc_call = mock.Mock(return_value=self.mock_proc)
+        self.mock_worker_call = mock.Mock(return_value=self.mock_worker)
+
+        patcher = mock.patch.multiple(
+            workers,
+            ThumbnailProcessing=self.mock_proc_call,
+            Worker=self.mock_worker_call,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(QtCore.QThreadPool, 'globalInstance',
+                                    return_value=self.mock_threadpool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_args_ThumbnailProcessing_called_with_if_lazy(self):
         self.w._lazy = True
-        with mock.patch(self.PROC+'ThumbnailProcessing') as mock_proc_call:
-            with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance'):
-                self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_proc_call.assert_called_once_with(self.w._image, self.w._size,
-                                               self.w)
+        self.mock_proc_call.assert_called_once_with(
+            self.w._image, self.w._size, self.w
+        )
 
     def test_ThumbnailProcessing_finished_connected_to_setThumbnail_if_l(self):
-        mock_proc = mock.Mock(spec=workers.ThumbnailProcessing)
-        with mock.patch(self.PROC+'ThumbnailProcessing',
-                        return_value=mock_proc):
-            with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance'):
-                self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_proc.finished.connect.assert_called_once_with(
+        self.mock_proc.finished.connect.assert_called_once_with(
             self.w._setThumbnail
         )
 
     def test_worker_created_if_lazy(self):
-        mock_processing_obj = mock.Mock(spec=workers.ThumbnailProcessing)
-        with mock.patch(self.PROC+'ThumbnailProcessing',
-                        return_value=mock_processing_obj):
-            with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance'):
-                with mock.patch(self.PROC+'Worker') as mock_worker_call:
-                    self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_worker_call.assert_called_once_with(mock_processing_obj.run)
+        self.mock_worker_call.assert_called_once_with(self.mock_proc.run)
 
     def test_worker_pushed_to_thread_if_lazy(self):
-        mock_threadpool = mock.Mock(spec=QtCore.QThreadPool)
-        mock_worker = mock.Mock(spec=workers.Worker)
-        with mock.patch(self.PROC+'ThumbnailProcessing'):
-            with mock.patch('PyQt5.QtCore.QThreadPool.globalInstance',
-                            return_value=mock_threadpool):
-                with mock.patch(self.PROC+'Worker', return_value=mock_worker):
-                    self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_threadpool.start.assert_called_once_with(mock_worker)
+        self.mock_threadpool.start.assert_called_once_with(self.mock_worker)
 
     def test_ThumbnailProcessing_called_with_image_and_size_if_not_lazy(self):
         self.w._lazy = False
-        with mock.patch(self.PROC+'ThumbnailProcessing') as mock_proc_call:
-            self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_proc_call.assert_called_once_with(self.w._image, self.w._size)
+        self.mock_proc_call.assert_called_once_with(self.w._image,
+                                                    self.w._size)
 
     def test_ThumbnailProcessing_run_called_if_not_lazy(self):
         self.w._lazy = False
-        mock_th_proc = mock.Mock(spec=workers.ThumbnailProcessing)
-        with mock.patch(self.PROC+'ThumbnailProcessing',
-                        return_value=mock_th_proc):
-            self.w._makeThumbnail()
+        self.w._makeThumbnail()
 
-        mock_th_proc.run.assert_called_once_with()
+        self.mock_proc.run.assert_called_once_with()
 
 
 class TestThumbnailWidgetMethodPaintEvent(TestThumbnailWidget):
@@ -453,185 +497,150 @@ class TestThumbnailWidgetMethodPaintEvent(TestThumbnailWidget):
         super().setUp()
 
         self.mock_event = mock.Mock(spec=QtCore.QEvent)
-        self.w._qtimer = mock.Mock(spec=QtCore.QTimer)
+        self.w._qtimer = mock.Mock(spec=QTIMER_SPEC)
+
+        patcher = mock.patch.object(QtWidgets.QLabel, 'paintEvent')
+        self.mock_paintEvent = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(THW_CLS, '_makeThumbnail')
+        self.mock_makeThumbnail = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_render_called_if_lazy_and_empty(self):
         self.w._lazy, self.w.empty = True, True
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent'):
-            with mock.patch(self.ThW+'_makeThumbnail') as mock_make_call:
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
 
-        mock_make_call.assert_called_once_with()
+        self.mock_makeThumbnail.assert_called_once_with()
 
     def test_QLabel_paintEvent_called_if_lazy_and_empty(self):
         self.w._lazy, self.w.empty = True, True
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent') as mock_ev_call:
-            with mock.patch(self.ThW+'_makeThumbnail'):
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
 
-        mock_ev_call.assert_called_once_with(self.mock_event)
+        self.mock_paintEvent.assert_called_once_with(self.mock_event)
 
     def test_render_not_called_if_lazy_and_not_empty(self):
         self.w._lazy, self.w.empty = True, False
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent'):
-            with mock.patch(self.ThW+'_makeThumbnail') as mock_make_call:
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
 
-        mock_make_call.assert_not_called()
+        self.mock_makeThumbnail.assert_not_called()
 
     def test_QLabel_paintEvent_called_if_lazy_and_not_empty(self):
         self.w._lazy, self.w.empty = True, False
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent') as mock_ev_call:
-            with mock.patch(self.ThW+'_makeThumbnail'):
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
 
-        mock_ev_call.assert_called_once_with(self.mock_event)
+        self.mock_paintEvent.assert_called_once_with(self.mock_event)
 
     def test_render_not_called_if_not_lazy(self):
         self.w._lazy = False
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent'):
-            with mock.patch(self.ThW+'_makeThumbnail') as mock_make_call:
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
 
-        mock_make_call.assert_not_called()
+        self.mock_makeThumbnail.assert_not_called()
 
     def test_QLabel_paintEvent_called_if_not_lazy(self):
         self.w._lazy = False
-        with mock.patch('PyQt5.QtWidgets.QLabel.paintEvent') as mock_ev_call:
-            with mock.patch(self.ThW+'_makeThumbnail'):
-                self.w.paintEvent(self.mock_event)
+        self.w.paintEvent(self.mock_event)
+
+        self.mock_paintEvent.assert_called_once_with(self.mock_event)
 
-        mock_ev_call.assert_called_once_with(self.mock_event)
 
+class TestThumbnailWidgetMethodClear(TestThumbnailWidgetShared):
 
-class TestThumbnailWidgetMethodClear(TestThumbnailWidget):
+    # Values of the attribute 'empty' and 'isVisible', and if the widget
+    # is cleared with them
+    STATES = (
+        (True, False, False),
+        (False, True, False),
+        (False, False, True),
+    )
 
     def setUp(self):
         super().setUp()
 
-        self.w._qtimer = mock.Mock(spec=QtCore.QTimer)
-
-    def test_qtimer_stop_not_called_if_empty(self):
-        self.w.empty = True
-        with mock.patch(self.ThW+'_setEmptyPixmap'):
-            self.w._clear()
-
-        self.w._qtimer.stop.assert_not_called()
+        self.w._qtimer = mock.Mock(spec=QTIMER_SPEC)
 
-    def test_setEmptyPixmap_not_called_if_empty(self):
-        self.w.empty = True
-        with mock.patch(self.ThW+'_setEmptyPixmap') as mock_set_call:
-            self.w._clear()
+        patcher = mock.patch.multiple(THW_CLS, isVisible=mock.DEFAULT,
+                                      _setEmptyPixmap=mock.DEFAULT)
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_isVisible = mocks['isVisible']
+        self.mock_setEmptyPixmap = mocks['_setEmptyPixmap']
 
-        mock_set_call.assert_not_called()
+    def _clear(self, empty, visible):
+        self.w._qtimer.reset_mock()
+        self.mock_setEmptyPixmap.reset_mock()
 
-    def test_attr_image_thumb_is_not_None_if_empty(self):
-        self.w.empty = True
+        self.w.empty = empty
         self.w._image.thumb = 'thumb'
-        with mock.patch(self.ThW+'_setEmptyPixmap'):
-            self.w._clear()
+        self.mock_isVisible.return_value = visible
+        self.w._clear()
 
-        self.assertIsNotNone(self.w._image.thumb)
+    def test_qtimer_stop_called_only_if_not_empty_and_not_visible(self):
+        for empty, visible, cleared in self.STATES:
+            with self.subTest(empty=empty, visible=visible):
+                self._clear(empty, visible)
 
-    def test_attr_empty_stay_True_if_empty(self):
-        self.w.empty = True
-        with mock.patch(self.ThW+'_setEmptyPixmap'):
-            self.w._clear()
+                self.assertEqual(self.w._qtimer.stop.called, cleared)
 
-        self.assertTrue(self.w.empty)
+    def test_setEmptyPixmap_called_only_if_not_empty_and_not_visible(self):
+        for empty, visible, cleared in self.STATES:
+            with self.subTest(empty=empty, visible=visible):
+                self._clear(empty, visible)
 
-    def test_qtimer_stop_not_called_if_not_empty_and_visible(self):
-        self.w.empty = False
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'_setEmptyPixmap'):
-                self.w._clear()
+                if cleared:
+                    self.mock_setEmptyPixmap.assert_called_once_with()
+                else:
+                    self.mock_setEmptyPixmap.assert_not_called()
 
-        self.w._qtimer.stop.assert_not_called()
+    def test_attr_image_thumb_set_to_None_only_if_not_empty_and_not_vis(self):
+        for empty, visible, cleared in self.STATES:
+            with self.subTest(empty=empty, visible=visible):
+                self._clear(empty, visible)
 
-    def test_setEmptyPixmap_not_called_if_not_empty_and_visible(self):
-        self.w.empty = False
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'_setEmptyPixmap') as mock_set_call:
-                self.w._clear()
-
-        mock_set_call.assert_not_called()
+                thumb = None if cleared else 'thumb'
+                self.assertEqual(self.w._image.thumb, thumb)
 
-    def test_attr_image_thumb_is_not_None_if_not_empty_and_visible(self):
-        self.w.empty = False
-        self.w._image.thumb = 'thumb'
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'_setEmptyPixmap'):
-                self.w._clear()
-
-        self.assertIsNotNone(self.w._image.thumb)
-
-    def test_attr_empty_stay_False_if_not_empty_and_visible(self):
-        self.w.empty = False
-        with mock.patch(self.ThW+'isVisible', return_value=True):
-            with mock.patch(self.ThW+'_setEmptyPixmap'):
-                self.w._clear()
-
-        self.assertFalse(self.w.empty)
+    def test_attr_empty_True_after_clear_only_if_was_empty_or_cleared(self):
+        for empty, visible, cleared in self.STATES:
+            with self.subTest(empty=empty, visible=visible):
+                self._clear(empty, visible)
 
-    def test_setEmptyPixmap_called_if_not_empty_and_not_visible(self):
-        self.w.empty = False
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'_setEmptyPixmap') as mock_set_call:
-                self.w._clear()
-
-        mock_set_call.assert_called_once_with()
-
-    def test_attr_image_thumb_set_to_None_if_not_empty_and_not_visible(self):
-        self.w.empty = False
-        self.w._image.thumb = 'thumb'
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'_setEmptyPixmap'):
-                self.w._clear()
-
-        self.assertIsNone(self.w._image.thumb)
-
-    def test_attr_empty_set_to_True_if_not_empty_and_not_visible(self):
-        self.w.empty = False
-        with mock.patch(self.ThW+'isVisible', return_value=False):
-            with mock.patch(self.ThW+'_setEmptyPixmap'):
-                self.w._clear()
-
-        self.assertTrue(self.w.empty)
+                self.assertEqual(self.w.empty, empty or cleared)
 
 
-class TestThumbnailWidgetMethodMark(TestThumbnailWidget):
+class TestThumbnailWidgetMethodMark(TestThumbnailWidgetShared):
 
     def setUp(self):
         super().setUp()
 
-        self.w._pixmap = mock.Mock(spec=QtGui.QPixmap)
-        self.copy = mock.Mock(spec=QtGui.QPixmap)
+        self.w._pixmap = mock.Mock(spec=QPIXMAP_SPEC)
+        self.copy = mock.Mock(spec=QPIXMAP_SPEC)
 
-    @mock.patch('PyQt5.QtGui.QBrush')
-    @mock.patch('PyQt5.QtGui.QPainter')
+    @mock.patch.object(QtGui, 'QBrush')
+    @mock.patch.object(QtGui, 'QPainter')
     def test_setPixmap_called_with_darker_thumbnail(self, mock_paint, mock_br):
         self.w._pixmap.copy.return_value = self.copy
-        with mock.patch(self.ThW+'setPixmap') as mock_pixmap_call:
+        with mock.patch.object(THW_CLS, 'setPixmap') as mock_pixmap_call:
             self.w._mark()
 
         mock_pixmap_call.assert_called_once_with(self.copy)
 
 
-class TestThumbnailWidgetMethodSetMarked(TestThumbnailWidget):
+class TestThumbnailWidgetMethodSetMarked(TestThumbnailWidgetShared):
 
     def setUp(self):
         super().setUp()
 
-        self.w._pixmap = mock.Mock(spec=QtGui.QPixmap)
+        self.w._pixmap = mock.Mock(spec=QPIXMAP_SPEC)
 
     def test_mark_called_if_pass_True(self):
-        with mock.patch(self.ThW+'_mark') as mock_mark_call:
+        with mock.patch.object(THW_CLS, '_mark') as mock_mark_call:
             self.w.setMarked(True)
 
         mock_mark_call.assert_called_once_with()
 
     def test_setPixmap_with_pixmap_attr_called_if_pass_False(self):
-        with mock.patch(self.ThW+'setPixmap') as mock_pixmap_call:
+        with mock.patch.object(THW_CLS, 'setPixmap') as mock_pixmap_call:
             self.w.setMarked(False)
 
         mock_pixmap_call.assert_called_once_with(self.w._pixmap)
@@ -17,7 +17,6 @@ along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
 from unittest import TestCase, mock
-import sys
 
 from myfyrio.gui import utils
 
@@ -26,40 +25,26 @@ from myfyrio.gui import utils
 
 class TestFuncOpenFile(TestCase):
 
-    def setUp(self):
-        self.real_platform = sys.platform
+    # Platform and the command used to open a file on it
+    COMMANDS = (
+        ('linux', 'xdg-open'),
+        ('win32', 'explorer'),
+        ('darwin', 'open'),
+        ('whatever_platform', 'Unknown platform'),
+    )
 
+    def setUp(self):
         self.path = '/path/to/FileOrDirectory'
 
-    def tearDown(self):
-        sys.platform = self.real_platform
-
-    def test_subprocess_run_called_with_linux_img_viewer_cmd(self):
-        sys.platform = 'linux'
-        with mock.patch('subprocess.run') as mock_run:
-            utils.openFile(self.path)
-
-        mock_run.assert_called_once_with(['xdg-open', self.path], check=True)
-
-    def test_subprocess_run_called_with_win_img_viewer_cmd(self):
-        sys.platform = 'win32'
-        with mock.patch('subprocess.run') as mock_run:
-            utils.openFile(self.path)
-
-        mock_run.assert_called_once_with(['explorer', self.path], check=True)
-
-    def test_subprocess_run_called_with_mac_img_viewer_cmd(self):
-        sys.platform = 'darwin'
-        with mock.patch('subprocess.run') as mock_run:
-            utils.openFile(self.path)
-
-        mock_run.assert_called_once_with(['open', self.path], check=True)
-
-    def test_subprocess_run_called_with_unknown_paltform(self):
-        sys.platform = 'whatever_platform'
-        with mock.patch('subprocess.run') as mock_run:
-            utils.openFile(self.path)
-
-        mock_run.assert_called_once_with(
-            ['Unknown platform', self.path], check=True
-        )
+    @mock.patch('subprocess.run')
+    def test_subprocess_run_called_with_platform_img_viewer_cmd(
+            self, mock_run
+    ):
+        for platform, command in self.COMMANDS:
+            with self.subTest(platform=platform):
+                mock_run.reset_mock()
+                with mock.patch('sys.platform', platform):
+                    utils.openFile(self.path)
+
+                mock_run.assert_called_once_with([command, self.path],
+                                                 check=True)
@@ -16,31 +16,25 @@ You should have received a copy of the GNU General Public License
 along with Myfyrio. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-import logging
 import sys
 from multiprocessing import pool
 from unittest import TestCase, mock
 
-from PyQt5 import QtGui, QtTest, QtWidgets
+from PyQt5 import QtGui
 
 from myfyrio import cache, core, workers
 from myfyrio.gui import thumbnailwidget
+from tests import _qapp, helpers
 
-# Configure a logger for testing purposes
-logger = logging.getLogger('main')
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    nh = logging.NullHandler()
-    logger.addHandler(nh)
-
-# Check if there's QApplication instance already
-app = QtWidgets.QApplication.instance()
-if app is None:
-    app = QtWidgets.QApplication([])
+# Widgets need the QApplication instance
+app = _qapp.instance()
 
 CORE = 'myfyrio.core.'
 PROCESSING = 'myfyrio.workers.'
 
+IMAGE_SPEC = helpers.specOf(core.Image)
+THUMBNAIL_WIDGET_SPEC = helpers.specOf(thumbnailwidget.ThumbnailWidget)
+
 # pylint: disable=missing-class-docstring
 
 
@@ -105,19 +99,18 @@ class TestClassImageProcessingMethodRun(TestClassImageProcessing):
         self.assertTrue(self.proc.error)
 
     def test_emit_signal_error_with_err_msg_if_any_func_raise_Exception(self):
-        spy = QtTest.QSignalSpy(self.proc.error)
+        mock_slot = helpers.connectMockSlot(self, self.proc.error)
         with mock.patch(self.PATCH_FIND, side_effect=Exception('Error')):
             self.proc.run()
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 'Error')
+        mock_slot.assert_called_once_with('Error')
 
     def test_emit_signal_interrupted_if_any_func_raise_Exception(self):
-        spy = QtTest.QSignalSpy(self.proc.interrupted)
+        mock_slot = helpers.connectMockSlot(self, self.proc.interrupted)
         with mock.patch(self.PATCH_FIND, side_effect=Exception):
             self.proc.run()
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
 
 class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
@@ -125,7 +118,7 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def setUp(self):
         super().setUp()
 
-        self.mock_image = mock.Mock(spec=core.Image)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
         self.mock_image.width = 5
         self.mock_image.height = 5
         self.found_images = (img for img in [self.mock_image])
@@ -148,12 +141,11 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def test_emit_images_loaded_signal_if_no_size_filter(self):
         self.mock_image.width = 100
         self.mock_image.height = 100
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 1)
+        mock_slot.assert_called_once_with(1)
 
     def test_return_images_if_size_filter_and_image_fits(self):
         self.conf['filter_img_size'] = True
@@ -164,12 +156,11 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
 
     def test_emit_images_loaded_signal_if_size_filter_and_image_fits(self):
         self.conf['filter_img_size'] = True
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 1)
+        mock_slot.assert_called_once_with(1)
 
     def test_return_empty_set_if_size_filter_and_too_small_width(self):
         self.conf['filter_img_size'] = True
@@ -182,21 +173,20 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def test_not_emit_images_loaded_if_size_filter_and_too_small_width(self):
         self.conf['filter_img_size'] = True
         self.mock_image.width = 4
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
     def test_emit_stop_image_group_if_size_filter_and_too_small_width(self):
         self.conf['filter_img_size'] = True
         self.mock_image.width = 4
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTupleEqual(spy[0][0], (0, []))
+        mock_slot.assert_called_once_with((0, []))
 
     def test_return_empty_set_if_size_filter_and_too_big_width(self):
         self.conf['filter_img_size'] = True
@@ -209,21 +199,20 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def test_not_emit_images_loaded_if_size_filter_and_too_big_width(self):
         self.conf['filter_img_size'] = True
         self.mock_image.width = 11
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
     def test_emit_stop_image_group_if_size_filter_and_too_big_width(self):
         self.conf['filter_img_size'] = True
         self.mock_image.width = 11
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTupleEqual(spy[0][0], (0, []))
+        mock_slot.assert_called_once_with((0, []))
 
     def test_return_empty_set_if_size_filter_and_too_small_height(self):
         self.conf['filter_img_size'] = True
@@ -236,21 +225,20 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def test_not_emit_images_loaded_if_size_filter_and_too_small_height(self):
         self.conf['filter_img_size'] = True
         self.mock_image.height = 4
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
     def test_emit_stop_image_group_if_size_filter_and_too_small_height(self):
         self.conf['filter_img_size'] = True
         self.mock_image.height = 4
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTupleEqual(spy[0][0], (0, []))
+        mock_slot.assert_called_once_with((0, []))
 
     def test_return_empty_set_if_size_filter_and_too_big_height(self):
         self.conf['filter_img_size'] = True
@@ -263,29 +251,28 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
     def test_not_emit_images_loaded_if_size_filter_and_too_big_height(self):
         self.conf['filter_img_size'] = True
         self.mock_image.height = 11
-        spy = QtTest.QSignalSpy(self.proc.images_loaded)
+        mock_slot = helpers.connectMockSlot(self, self.proc.images_loaded)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
     def test_emit_stop_image_group_if_size_filter_and_too_big_height(self):
         self.conf['filter_img_size'] = True
         self.mock_image.height = 11
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTupleEqual(spy[0][0], (0, []))
+        mock_slot.assert_called_once_with((0, []))
 
     def test_emit_interrupted_signal_if_attr_interrupt_True(self):
         self.proc._interrupted = True
-        spy = QtTest.QSignalSpy(self.proc.interrupted)
+        mock_slot = helpers.connectMockSlot(self, self.proc.interrupted)
         with mock.patch(CORE+'find_image', return_value=self.found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_return_empty_set_if_attr_interrupt_True(self):
         self.proc._interrupted = True
@@ -296,12 +283,11 @@ class TestClassImageProcessingMethodFindImages(TestClassImageProcessing):
 
     def test_emit_image_group_signal_with_empty_list_if_images_not_found(self):
         found_images = (img for img in [])
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'find_image', return_value=found_images):
             self.proc._find_images()
 
-        self.assertEqual(len(spy), 1)
-        self.assertTupleEqual(spy[0][0], (0, []))
+        mock_slot.assert_called_once_with((0, []))
 
     def test_return_empty_set_if_images_not_found(self):
         found_images = (img for img in [])
@@ -355,9 +341,9 @@ class TestMethodCheckCache(TestClassImageProcessing):
     def setUp(self):
         super().setUp()
 
-        self.mock_img1 = mock.Mock(spec=core.Image)
+        self.mock_img1 = mock.Mock(spec=IMAGE_SPEC)
         self.mock_img1.path = 'path'
-        self.mock_img2 = mock.Mock(spec=core.Image)
+        self.mock_img2 = mock.Mock(spec=IMAGE_SPEC)
         self.mock_img2.path = 'path_not_in_cache'
         self.paths = [self.mock_img1, self.mock_img2]
         self.cache = {'path': 'hash'}
@@ -374,11 +360,10 @@ class TestMethodCheckCache(TestClassImageProcessing):
         self.assertEqual(self.mock_img1.dhash, 'hash')
 
     def test_emit_found_in_cache_with_found_in_cache_images_number_arg(self):
-        spy = QtTest.QSignalSpy(self.proc.found_in_cache)
+        mock_slot = helpers.connectMockSlot(self, self.proc.found_in_cache)
         self.proc._check_cache(self.paths, self.cache)
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 1)
+        mock_slot.assert_called_once_with(1)
 
     def test_update_progressbar_called_with_35_if_there_arent_not_cached(self):
         paths = self.paths[:1]
@@ -405,11 +390,11 @@ class TestClassImageProcessingMethodCalculateHashes(TestClassImageProcessing):
     def setUp(self):
         super().setUp()
 
-        mock_img = mock.Mock(spec=core.Image)
+        mock_img = mock.Mock(spec=IMAGE_SPEC)
         self.images = [mock_img]
 
         self.mock_Pool = mock.MagicMock(spec=pool.Pool)
-        self.mock_context_obj = mock.Mock()
+        self.mock_context_obj = mock.NonCallableMock(spec_set=['imap'])
         self.mock_Pool.__enter__.return_value = self.mock_context_obj
         imap_return = (h for h in self.images)
         self.mock_context_obj.imap.return_value = imap_return
@@ -437,12 +422,11 @@ class TestClassImageProcessingMethodCalculateHashes(TestClassImageProcessing):
         self.assertListEqual(res, self.images)
 
     def test_emit_hashes_calculated_with_calculated_hashes_number_arg(self):
-        spy = QtTest.QSignalSpy(self.proc.hashes_calculated)
+        mock_slot = helpers.connectMockSlot(self, self.proc.hashes_calculated)
         with mock.patch(PROCESSING+'Pool', return_value=self.mock_Pool):
             self.proc._calculate_hashes(self.images)
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 1)
+        mock_slot.assert_called_once_with(1)
 
     def test_update_progressbar_called_with_current_value_plus_step(self):
         self.proc._progressbar_value = 2
@@ -470,7 +454,7 @@ class TestClassImageProcessingMethodUpdateCache(TestClassImageProcessing):
 
         self.mock_cache = mock.MagicMock(spec=cache.Cache)
 
-        self.mock_image = mock.Mock(spec=core.Image)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
         self.mock_image.path = 'path'
         self.mock_image.dhash = 'hash'
         self.images = [self.mock_image]
@@ -487,12 +471,11 @@ class TestClassImageProcessingMethodUpdateCache(TestClassImageProcessing):
 
     def test_emit_signal_error_with_err_msg_if_hash_is_minus_1(self):
         self.mock_image.dhash = -1
-        spy = QtTest.QSignalSpy(self.proc.error)
+        mock_slot = helpers.connectMockSlot(self, self.proc.error)
         self.proc._update_cache(self.mock_cache, self.images)
 
-        self.assertEqual(len(spy), 1)
         err_msg = 'Hash of the "path" image cannot be calculated'
-        self.assertEqual(spy[0][0], err_msg)
+        mock_slot.assert_called_once_with(err_msg)
 
     def test_cache_save_called_with_cache_file_path_arg(self):
         with mock.patch('myfyrio.resources.Cache.get',
@@ -531,47 +514,46 @@ class TestClassImageProcessingMethodImageGrouping(TestClassImageProcessing):
 
     def test_emit_image_group_signal_with_found_group_and_stop_group(self):
         gen = (g for g in [(0, self.images)])
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'image_grouping', return_value=gen):
             self.proc._image_grouping(self.images)
 
-        self.assertEqual(len(spy), 2)
-        self.assertTupleEqual(spy[0][0], (0, self.images))
-        self.assertTupleEqual(spy[1][0], (0, []))
+        self.assertListEqual(mock_slot.call_args_list,
+                             [mock.call((0, self.images)), mock.call((0, []))])
 
     def test_emit_interrupted_signal_if_attr_interrupted_is_True(self):
         self.proc._interrupted = True
         gen = (g for g in [(0, self.images)])
-        spy = QtTest.QSignalSpy(self.proc.interrupted)
+        mock_slot = helpers.connectMockSlot(self, self.proc.interrupted)
         with mock.patch(CORE+'image_grouping', return_value=gen):
             self.proc._image_grouping(self.images)
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_not_emit_image_group_signal_if_attr_interrupted_is_True(self):
         self.proc._interrupted = True
         gen = (g for g in [(0, self.images)])
-        spy = QtTest.QSignalSpy(self.proc.image_group)
+        mock_slot = helpers.connectMockSlot(self, self.proc.image_group)
         with mock.patch(CORE+'image_grouping', return_value=gen):
             self.proc._image_grouping(self.images)
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
     def test_emit_duplicates_found_signal_with_duplicates_found_num_arg(self):
         gen = (g for g in [(0, self.images)])
-        spy = QtTest.QSignalSpy(self.proc.duplicates_found)
+        mock_slot = helpers.connectMockSlot(self, self.proc.duplicates_found)
         with mock.patch(CORE+'image_grouping', return_value=gen):
             self.proc._image_grouping(self.images)
 
-        self.assertEqual(spy[0][0], 2)
+        mock_slot.assert_called_once_with(2)
 
     def test_emit_groups_found_signal_with_duplicate_groups_found_arg(self):
         gen = (g for g in [(0, self.images)])
-        spy = QtTest.QSignalSpy(self.proc.groups_found)
+        mock_slot = helpers.connectMockSlot(self, self.proc.groups_found)
         with mock.patch(CORE+'image_grouping', return_value=gen):
             self.proc._image_grouping(self.images)
 
-        self.assertEqual(spy[0][0], 1)
+        mock_slot.assert_called_once_with(1)
 
     def test_update_progress_bar_called_with_class_attr_PROG_MAX(self):
         gen = (g for g in [(0, self.images)])
@@ -631,24 +613,23 @@ class TestClassImageProcessingMetodUpdateProgressbar(TestClassImageProcessing):
 
     def test_emit_update_progressbar_signal_if_whole_part_changed(self):
         self.proc._progressbar_value = 10.5
-        spy = QtTest.QSignalSpy(self.proc.update_progressbar)
+        mock_slot = helpers.connectMockSlot(self, self.proc.update_progressbar)
         self.proc._update_progressbar(11.2)
 
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], 11)
+        mock_slot.assert_called_once_with(11)
 
     def test_not_emit_update_progressbar_if_whole_part_not_changed(self):
         self.proc._progressbar_value = 10.5
-        spy = QtTest.QSignalSpy(self.proc.update_progressbar)
+        mock_slot = helpers.connectMockSlot(self, self.proc.update_progressbar)
         self.proc._update_progressbar(10.7)
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()
 
 
 class TestClassThumbnailProcessing(TestCase):
 
     def setUp(self):
-        self.mock_image = mock.Mock(spec=core.Image)
+        self.mock_image = mock.Mock(spec=IMAGE_SPEC)
         self.mock_image.thumb = None
         self.mock_image.path = 'path'
         self.size = 200
@@ -684,13 +665,13 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
         self.assertEqual(self.proc._image.thumb, QtGui.QImage())
 
     def test_signal_finished_emitted_if_widget_None(self):
-        spy = QtTest.QSignalSpy(self.proc.finished)
+        mock_slot = helpers.connectMockSlot(self, self.proc.finished)
         self.proc.run()
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_thumbnail_called_with_size_arg_if_widg_not_None_and_visible(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = True
         self.proc._widget = widget
         self.mock_image.thumbnail.return_value = QtGui.QImage()
@@ -699,7 +680,7 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
         self.mock_image.thumbnail.assert_called_once_with(self.size)
 
     def test_logging_if_OSError_and_widget_not_None_and_visible(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = True
         self.proc._widget = widget
         self.mock_image.thumbnail.side_effect = OSError
@@ -707,7 +688,7 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
             self.proc.run()
 
     def test_empty_QImage_set_to_thumb_if_OSError_widg_not_None_and_vis(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = True
         self.proc._widget = widget
         self.mock_image.thumbnail.side_effect = OSError
@@ -716,16 +697,16 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
         self.assertEqual(self.proc._image.thumb, QtGui.QImage())
 
     def test_signal_finished_emitted_if_widget_not_None_and_visible(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = True
         self.proc._widget = widget
-        spy = QtTest.QSignalSpy(self.proc.finished)
+        mock_slot = helpers.connectMockSlot(self, self.proc.finished)
         self.proc.run()
 
-        self.assertEqual(len(spy), 1)
+        mock_slot.assert_called_once_with()
 
     def test_thumbnail_not_called_with_size_arg_if_widg_not_None_not_vis(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = False
         self.proc._widget = widget
         self.mock_image.thumbnail.return_value = QtGui.QImage()
@@ -734,7 +715,7 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
         self.mock_image.thumbnail.assert_not_called()
 
     def test_empty_QImage_not_to_thumb_if_OSError_widg_not_None_not_vis(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = False
         self.proc._widget = widget
         self.mock_image.thumbnail.side_effect = OSError
@@ -743,10 +724,10 @@ class TestClassThumbnailProcessingMethodRun(TestClassThumbnailProcessing):
         self.assertIsNone(self.proc._image.thumb)
 
     def test_signal_finished_not_emitted_if_widget_not_None_and_not_vis(self):
-        widget = mock.Mock(spec=thumbnailwidget.ThumbnailWidget)
+        widget = mock.Mock(spec=THUMBNAIL_WIDGET_SPEC)
         widget.isVisible.return_value = False
         self.proc._widget = widget
-        spy = QtTest.QSignalSpy(self.proc.finished)
+        mock_slot = helpers.connectMockSlot(self, self.proc.finished)
         self.proc.run()
 
-        self.assertEqual(len(spy), 0)
+        mock_slot.assert_not_called()